@@ -12,29 +12,33 @@ SPDX-License-Identifier: GPL-3.0-or-later
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from logging import basicConfig as logging_basicConfig
 from logging import debug as logging_debug
 from logging import error as logging_error
 from logging import getLevelName as logging_getLevelName
 from logging import info as logging_info
 from sys import exit as sys_exit
-from typing import Union
+from typing import TYPE_CHECKING, Union
 from webbrowser import open as webbrowser_open
 
-import argcomplete
-
 from ardupilot_methodic_configurator import _, __version__
-from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
-from ardupilot_methodic_configurator.backend_filesystem_program_settings import ProgramSettings
-from ardupilot_methodic_configurator.backend_flightcontroller import FlightController
-from ardupilot_methodic_configurator.common_arguments import add_common_arguments
-from ardupilot_methodic_configurator.frontend_tkinter_base import show_error_message
-from ardupilot_methodic_configurator.frontend_tkinter_component_editor import ComponentEditorWindow
-from ardupilot_methodic_configurator.frontend_tkinter_connection_selection import ConnectionSelectionWindow
-from ardupilot_methodic_configurator.frontend_tkinter_directory_selection import VehicleDirectorySelectionWindow
-from ardupilot_methodic_configurator.frontend_tkinter_flightcontroller_info import FlightControllerInfoWindow
-from ardupilot_methodic_configurator.frontend_tkinter_parameter_editor import ParameterEditorWindow
-from ardupilot_methodic_configurator.middleware_software_updates import UpdateManager, check_for_software_updates
+from ardupilot_methodic_configurator.common_arguments import (
+    add_common_arguments,
+    add_component_editor_arguments,
+    add_filesystem_arguments,
+    add_flight_controller_arguments,
+    add_parameter_editor_arguments,
+    add_update_manager_arguments,
+)
+
+# The Tk frontend and flight controller backend imports are deliberately deferred into the
+# functions that need them: importing the Tk stack costs hundreds of milliseconds, which
+# dominates --help, --version and argument-error startup paths that never open a window
+if TYPE_CHECKING:
+    from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
+    from ardupilot_methodic_configurator.backend_flightcontroller import FlightController
+    from ardupilot_methodic_configurator.frontend_tkinter_directory_selection import VehicleDirectorySelectionWindow
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -59,24 +63,34 @@ def create_argument_parser() -> argparse.ArgumentParser:
             "The process gets repeated for each intermediate parameter file."
         )
     )
-    parser = FlightController.add_argparse_arguments(parser)
-    parser = LocalFilesystem.add_argparse_arguments(parser)
-    parser = ComponentEditorWindow.add_argparse_arguments(parser)
-    parser = ParameterEditorWindow.add_argparse_arguments(parser)
-    parser = UpdateManager.add_argparse_arguments(parser)
+    import argcomplete  # pylint: disable=import-outside-toplevel
+
+    parser = add_flight_controller_arguments(parser)
+    parser = add_filesystem_arguments(parser)
+    parser = add_component_editor_arguments(parser)
+    parser = add_parameter_editor_arguments(parser)
+    parser = add_update_manager_arguments(parser)
     parser = add_common_arguments(parser)
 
     argcomplete.autocomplete(parser)
     return parser
 
 
-def connect_to_fc_and_set_vehicle_type(args: argparse.Namespace) -> tuple[FlightController, str]:
+def connect_to_fc_and_set_vehicle_type(args: argparse.Namespace) -> tuple["FlightController", str]:
+    from ardupilot_methodic_configurator.backend_flightcontroller import (  # pylint: disable=import-outside-toplevel
+        FlightController,
+    )
+
     flight_controller = FlightController(args.reboot_time)
 
     error_str = flight_controller.connect(args.device, log_errors=False)
     if error_str:
         if args.device and _("No serial ports found") not in error_str:
             logging_error(error_str)
+        from ardupilot_methodic_configurator.frontend_tkinter_connection_selection import (  # pylint: disable=import-outside-toplevel
+            ConnectionSelectionWindow,
+        )
+
         conn_sel_window = ConnectionSelectionWindow(flight_controller, error_str)
         conn_sel_window.root.mainloop()
 
@@ -93,11 +107,18 @@ def connect_to_fc_and_set_vehicle_type(args: argparse.Namespace) -> tuple[Flight
 
 def component_editor(
     args: argparse.Namespace,
-    flight_controller: FlightController,
+    flight_controller: "FlightController",
     vehicle_type: str,
-    local_filesystem: LocalFilesystem,
-    vehicle_dir_window: Union[None, VehicleDirectorySelectionWindow],
+    local_filesystem: "LocalFilesystem",
+    vehicle_dir_window: Union[None, "VehicleDirectorySelectionWindow"],
 ) -> None:
+    # pylint: disable=import-outside-toplevel
+    from ardupilot_methodic_configurator.backend_filesystem_program_settings import ProgramSettings
+    from ardupilot_methodic_configurator.frontend_tkinter_base import show_error_message
+    from ardupilot_methodic_configurator.frontend_tkinter_component_editor import ComponentEditorWindow
+
+    # pylint: enable=import-outside-toplevel
+
     component_editor_window = ComponentEditorWindow(__version__, local_filesystem)
     if (
         vehicle_dir_window
@@ -143,6 +164,17 @@ def main() -> None:
 
     logging_basicConfig(level=logging_getLevelName(args.loglevel), format="%(asctime)s - %(levelname)s - %(message)s")
 
+    # pylint: disable=import-outside-toplevel
+    from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
+    from ardupilot_methodic_configurator.backend_filesystem_program_settings import ProgramSettings
+    from ardupilot_methodic_configurator.frontend_tkinter_base import show_error_message
+    from ardupilot_methodic_configurator.frontend_tkinter_directory_selection import VehicleDirectorySelectionWindow
+    from ardupilot_methodic_configurator.frontend_tkinter_flightcontroller_info import FlightControllerInfoWindow
+    from ardupilot_methodic_configurator.frontend_tkinter_parameter_editor import ParameterEditorWindow
+    from ardupilot_methodic_configurator.middleware_software_updates import check_for_software_updates
+
+    # pylint: enable=import-outside-toplevel
+
     if not args.skip_check_for_updates and check_for_software_updates():
         logging_info(_("Will now exit the old software version."))
         sys_exit(0)
@@ -157,18 +189,27 @@ def main() -> None:
     # Connect to the flight controller and read the parameters
     flight_controller, vehicle_type = connect_to_fc_and_set_vehicle_type(args)
 
-    param_default_values = {}
-    if flight_controller.master is not None or args.device == "test":
-        fciw = FlightControllerInfoWindow(flight_controller)
-        param_default_values = fciw.get_param_default_values()
-
-    try:
-        local_filesystem = LocalFilesystem(
-            args.vehicle_dir, vehicle_type, flight_controller.info.flight_sw_version, args.allow_editing_template_files
+    # Start the I/O-bound LocalFilesystem scan in the background so it overlaps with the
+    # time the user spends looking at the flight controller info window
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        local_filesystem_future = executor.submit(
+            LocalFilesystem,
+            args.vehicle_dir,
+            vehicle_type,
+            flight_controller.info.flight_sw_version,
+            args.allow_editing_template_files,
         )
-    except SystemExit as exp:
-        show_error_message(_("Fatal error reading parameter files"), f"{exp}")
-        raise
+
+        param_default_values = {}
+        if flight_controller.master is not None or args.device == "test":
+            fciw = FlightControllerInfoWindow(flight_controller)
+            param_default_values = fciw.get_param_default_values()
+
+        try:
+            local_filesystem = local_filesystem_future.result()
+        except SystemExit as exp:
+            show_error_message(_("Fatal error reading parameter files"), f"{exp}")
+            raise
 
     param_default_values_dirty = False
     if param_default_values:
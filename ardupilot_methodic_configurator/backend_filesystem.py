@@ -26,8 +26,6 @@ from subprocess import SubprocessError, run
 from typing import Any, Optional
 from zipfile import ZipFile
 
-from argcomplete.completers import DirectoriesCompleter
-
 from ardupilot_methodic_configurator import _
 from ardupilot_methodic_configurator.annotate_params import (
     PARAM_DEFINITION_XML_FILE,
@@ -43,6 +41,7 @@ from ardupilot_methodic_configurator.annotate_params import (
 from ardupilot_methodic_configurator.backend_filesystem_configuration_steps import ConfigurationSteps
 from ardupilot_methodic_configurator.backend_filesystem_program_settings import ProgramSettings
 from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import VehicleComponents
+from ardupilot_methodic_configurator.common_arguments import add_filesystem_arguments
 
 TOOLTIP_MAX_LENGTH = 105
 
@@ -715,38 +714,6 @@ class LocalFilesystem(VehicleComponents, ConfigurationSteps, ProgramSettings):
 
     @staticmethod
     def add_argparse_arguments(parser: ArgumentParser) -> ArgumentParser:
-        parser.add_argument(
-            "-t",
-            "--vehicle-type",
-            choices=VehicleComponents.supported_vehicles(),
-            default="",
-            help=_("The type of the vehicle. Default is ArduCopter"),
-        )
-        parser.add_argument(  # type: ignore[attr-defined]
-            "--vehicle-dir",
-            type=str,
-            default=os_getcwd(),
-            help=_(
-                "Directory containing vehicle-specific intermediate parameter files. Default is the current working directory"
-            ),
-        ).completer = DirectoriesCompleter()  # type: ignore[no-untyped-call]
-        parser.add_argument(
-            "--n",
-            type=int,
-            default=-1,
-            help=_(
-                "Start directly on the nth intermediate parameter file (skips previous files). "
-                "Default is to start on the file next to the last that you wrote to the flight controller. "
-                "If the file does not exist, it will start on the first file."
-            ),
-        )
-        parser.add_argument(
-            "--allow-editing-template-files",
-            action="store_true",
-            help=_(
-                "Allow opening and editing template files directly. "
-                "Only for software developers that know what they are doing. "
-                "Default is %(default)s"
-            ),
-        )
-        return parser
+        # the registration body lives in the lightweight common_arguments module, so the
+        # main entry point can build its parser without importing the backend through here
+        return add_filesystem_arguments(parser)
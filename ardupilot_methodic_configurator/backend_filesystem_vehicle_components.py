@@ -8,27 +8,130 @@ SPDX-FileCopyrightText: 2024-2025 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
 SPDX-License-Identifier: GPL-3.0-or-later
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from json import JSONDecodeError
 from json import dump as json_dump
 from json import load as json_load
-
-# from logging import info as logging_info
-# from logging import warning as logging_warning
-# from sys import exit as sys_exit
-from logging import debug as logging_debug
-from logging import error as logging_error
+from logging import DEBUG, ERROR, getLogger
+from os import chmod as os_chmod
 from os import makedirs as os_makedirs
 from os import path as os_path
-from os import walk as os_walk
-from re import match as re_match
-from typing import Any, Union
-
-from jsonschema import ValidationError, validate
+from os import remove as os_remove
+from os import replace as os_replace
+from os import scandir as os_scandir
+from os import stat as os_stat
+from os import umask as os_umask
+from re import compile as re_compile
+from stat import S_IMODE
+from tempfile import NamedTemporaryFile
+from typing import Any, ClassVar, TextIO, Union
+
+from jsonschema import Draft7Validator, ValidationError
+
+try:
+    from fastjsonschema import JsonSchemaException as FastJsonSchemaException
+    from fastjsonschema import compile as fastjsonschema_compile
+except ImportError:
+    fastjsonschema_compile = None  # type: ignore[assignment]
+
+try:
+    # orjson parses and serializes JSON in C, several times faster than the stdlib json module
+    from orjson import OPT_APPEND_NEWLINE, OPT_INDENT_2
+    from orjson import dumps as orjson_dumps
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_dumps = None  # type: ignore[assignment]
+    orjson_loads = None  # type: ignore[assignment]
+
+try:
+    # ijson streams JSON incrementally, so a subtree can be read without materializing
+    # the whole document
+    from ijson import JSONError as IjsonJSONError
+    from ijson import kvitems as ijson_kvitems
+except ImportError:
+    # placeholder exception type, the except clause using it is only reachable when ijson is installed
+    IjsonJSONError = ValueError  # type: ignore[assignment,misc]
+    ijson_kvitems = None  # type: ignore[assignment]
 
 from ardupilot_methodic_configurator import _
 from ardupilot_methodic_configurator.backend_filesystem_program_settings import ProgramSettings
 from ardupilot_methodic_configurator.middleware_template_overview import TemplateOverview
 
+# Resolve the logger once instead of going through the root-logger machinery on every call.
+# The error paths below can fire once per template directory during the overview scan, so
+# they are additionally gated with isEnabledFor to skip the gettext lookup when suppressed
+_logger = getLogger(__name__)
+
+_FW_VERSION_RE = re_compile(r"^\d+\.\d+\.\d+$")
+
+# Shared sentinel returned by load_schema when the schema can not be loaded, so repeated
+# failed loads do not allocate a fresh dict each time.  Callers only read it, never mutate
+_EMPTY_SCHEMA: dict[Any, Any] = {}
+
+
+def _json_dump_pretty(data: dict, file: TextIO) -> None:
+    """
+    Serialize data as indented JSON to an open text file.
+
+    Uses orjson's C serializer when available; the stdlib fallback emits the
+    same layout (2-space indent, raw unicode, trailing newline) so the bytes
+    on disk normally do not depend on which machine saved the file. The match
+    is approximate, not guaranteed: float spellings can differ (orjson writes
+    1e20 where the stdlib writes 1e+20), which at worst costs a one-time
+    rewrite when machines with and without orjson share a tree.
+
+    :param data: The data to serialize
+    :param file: An open text-mode file object
+    """
+    if orjson_dumps is not None:
+        file.write(orjson_dumps(data, option=OPT_INDENT_2 | OPT_APPEND_NEWLINE).decode("utf-8"))
+    else:
+        json_dump(data, file, indent=2, ensure_ascii=False)
+        file.write("\n")
+
+
+@lru_cache(maxsize=1)
+def _load_schema_cached(schema_path: str) -> Union[None, dict[Any, Any]]:
+    """
+    Load and parse the JSON schema file, shared by all VehicleComponents instances.
+
+    :param schema_path: Path to the schema file
+    :return: The schema as a dictionary, or None if it could not be loaded
+    """
+    try:
+        # binary mode: json_load detects the UTF-8 encoding itself, skipping the TextIOWrapper
+        with open(schema_path, "rb") as file:
+            return json_load(file)
+    except FileNotFoundError:
+        if _logger.isEnabledFor(ERROR):
+            _logger.error(_("Schema file '%s' not found."), schema_path)
+    except JSONDecodeError:
+        if _logger.isEnabledFor(ERROR):
+            _logger.error(_("Error decoding JSON schema from file '%s'."), schema_path)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _load_component_templates_cached(filepath: str) -> Union[None, dict[str, list[dict]]]:
+    """
+    Load and parse the component templates file, shared by all VehicleComponents instances.
+
+    :param filepath: Path to the templates file
+    :return: The templates as a dictionary, or None if it could not be loaded
+    """
+    try:
+        with open(filepath, "rb") as file:
+            return json_load(file)
+    except FileNotFoundError:
+        if _logger.isEnabledFor(ERROR):
+            _logger.error(_("Templates file '%s' not found."), filepath)
+    except JSONDecodeError:
+        if _logger.isEnabledFor(ERROR):
+            _logger.error(_("Error decoding JSON templates from file '%s'."), filepath)
+    return None
+
 
 class VehicleComponents:
     """
@@ -36,11 +139,41 @@ class VehicleComponents:
     vehicle components configurations from a JSON file.
     """
 
+    # Compiled schema validators, shared by all instances and keyed on schema path so the
+    # template-overview scan does not re-compile the same schema for every subdirectory
+    _validator_cache: ClassVar[dict[str, Draft7Validator]] = {}
+    # fastjsonschema code-generated validators, same keying. Only used when the optional
+    # fastjsonschema package is installed, the valid-document fast path is ~10x faster
+    _fast_validator_cache: ClassVar[dict[str, Any]] = {}
+    # Validation results memoized per file, keyed on path with the (mtime_ns, size) stamp,
+    # validity and error message as value, so unchanged files are validated only once
+    _validation_cache: ClassVar[dict[str, tuple[tuple[int, int], bool, str]]] = {}
+
+    _SUPPORTED_VEHICLES: ClassVar[tuple[str, ...]] = (
+        "AP_Periph",
+        "AntennaTracker",
+        "ArduCopter",
+        "ArduPlane",
+        "ArduSub",
+        "Blimp",
+        "Heli",
+        "Rover",
+        "SITL",
+    )
+    # frozenset for O(1) membership tests in the firmware-type hot path
+    _SUPPORTED_VEHICLES_SET: ClassVar[frozenset[str]] = frozenset(_SUPPORTED_VEHICLES)
+
+    # These filenames are constants, as class attributes they can be read without
+    # constructing a throwaway instance
+    vehicle_components_json_filename: ClassVar[str] = "vehicle_components.json"
+    vehicle_components_schema_filename: ClassVar[str] = "vehicle_components_schema.json"
+
     def __init__(self) -> None:
-        self.vehicle_components_json_filename = "vehicle_components.json"
-        self.vehicle_components_schema_filename = "vehicle_components_schema.json"
         self.vehicle_components: Union[None, dict[Any, Any]] = None
         self.schema: Union[None, dict[Any, Any]] = None
+        self._schema_loaded = False
+        self._validator: Union[None, Draft7Validator] = None
+        self._fast_validate: Any = None
 
     def load_schema(self) -> dict:
         """
@@ -48,21 +181,32 @@ class VehicleComponents:
 
         :return: The schema as a dictionary
         """
-        if self.schema is not None:
-            return self.schema
+        if self._schema_loaded:
+            # A failed load is also remembered, so repeated validations of the same instance
+            # do not retry the filesystem on every call
+            return self.schema if self.schema is not None else _EMPTY_SCHEMA
 
         # Determine the location of the schema file
         schema_path = os_path.join(os_path.dirname(__file__), self.vehicle_components_schema_filename)
 
-        try:
-            with open(schema_path, encoding="utf-8") as file:
-                self.schema = json_load(file)
-            return self.schema
-        except FileNotFoundError:
-            logging_error(_("Schema file '%s' not found."), schema_path)
-        except JSONDecodeError:
-            logging_error(_("Error decoding JSON schema from file '%s'."), schema_path)
-        return {}
+        self._schema_loaded = True
+        schema = _load_schema_cached(schema_path)
+        if schema is None:
+            return _EMPTY_SCHEMA
+        self.schema = schema
+        validator = VehicleComponents._validator_cache.get(schema_path)
+        if validator is None:
+            Draft7Validator.check_schema(self.schema)
+            validator = Draft7Validator(self.schema)
+            VehicleComponents._validator_cache[schema_path] = validator
+        self._validator = validator
+        if fastjsonschema_compile is not None:
+            fast_validate = VehicleComponents._fast_validator_cache.get(schema_path)
+            if fast_validate is None:
+                fast_validate = fastjsonschema_compile(self.schema)
+                VehicleComponents._fast_validator_cache[schema_path] = fast_validate
+            self._fast_validate = fast_validate
+        return self.schema
 
     def load_component_templates(self) -> dict[str, list[dict]]:
         """
@@ -74,15 +218,8 @@ class VehicleComponents:
         templates_dir = ProgramSettings.get_templates_base_dir()
         filepath = os_path.join(templates_dir, templates_filename)
 
-        templates = {}
-        try:
-            with open(filepath, encoding="utf-8") as file:
-                templates = json_load(file)
-        except FileNotFoundError:
-            logging_error(_("Templates file '%s' not found."), filepath)
-        except JSONDecodeError:
-            logging_error(_("Error decoding JSON templates from file '%s'."), filepath)
-        return templates
+        templates = _load_component_templates_cached(filepath)
+        return templates if templates is not None else {}
 
     def save_component_templates(self, templates: dict) -> tuple[bool, str]:
         """
@@ -99,11 +236,12 @@ class VehicleComponents:
         try:
             os_makedirs(templates_dir, exist_ok=True)
             with open(filepath, "w", encoding="utf-8") as file:
-                json_dump(templates, file, indent=4)
+                _json_dump_pretty(templates, file)
         except FileNotFoundError:
             msg = _("Failed to save templates to file '{}': {}").format(filepath, _("File not found"))
-            logging_error(msg)
+            _logger.error(msg)
             return True, msg
+        _load_component_templates_cached.cache_clear()  # the cached copy is now stale
         return False, ""
 
     def validate_vehicle_components(self, data: dict) -> tuple[bool, str]:
@@ -117,33 +255,122 @@ class VehicleComponents:
         if not schema:
             return False, _("Could not load validation schema")
 
+        if self._fast_validate is not None:
+            # fast path: fastjsonschema generates specialized validation code per schema,
+            # fall back to jsonschema below only to produce its richer error message
+            try:
+                self._fast_validate(data)
+                return True, ""
+            except FastJsonSchemaException:
+                pass
+
+        if self._validator is None:
+            # load_schema() was overridden or monkeypatched, compile the schema it returned
+            self._validator = Draft7Validator(schema)
+
         try:
-            validate(instance=data, schema=schema)
+            self._validator.validate(data)
             return True, ""
         except ValidationError as e:
             return False, f"{_('Validation error')}: {e.message}"
 
-    def load_vehicle_components_json_data(self, vehicle_dir: str) -> dict[Any, Any]:
+    @staticmethod
+    def _read_json_file(filepath: str) -> dict[Any, Any]:
+        """
+        Read and parse a JSON file, exceptions propagate to the caller.
+
+        :param filepath: Path to the JSON file
+        :return: The parsed data as a dictionary
+        """
+        if orjson_loads is not None:
+            with open(filepath, "rb") as file:
+                parsed: dict[Any, Any] = orjson_loads(file.read())
+                return parsed
+        with open(filepath, "rb") as file:
+            loaded: dict[Any, Any] = json_load(file)
+            return loaded
+
+    def _validate_vehicle_components_cached(self, data: dict, filepath: str) -> tuple[bool, str]:
+        """
+        Validate vehicle components data, memoizing the result on the file's mtime and size.
+
+        :param data: The vehicle components data to validate
+        :param filepath: The file the data was read from, used as cache key
+        :return: A tuple of (is_valid, error_message)
+        """
+        try:
+            stat_result = os_stat(filepath)
+            stamp: Union[None, tuple[int, int]] = (stat_result.st_mtime_ns, stat_result.st_size)
+        except OSError:
+            stamp = None
+        cached = VehicleComponents._validation_cache.get(filepath) if stamp is not None else None
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        is_valid, error_message = self.validate_vehicle_components(data)
+        if stamp is not None:
+            VehicleComponents._validation_cache[filepath] = (stamp, is_valid, error_message)
+        return is_valid, error_message
+
+    def load_vehicle_components_json_data(self, vehicle_dir: str, validate: bool = True) -> dict[Any, Any]:
+        """
+        Load the vehicle components data from a JSON file.
+
+        :param vehicle_dir: The directory containing the vehicle_components.json file
+        :param validate: Validate the loaded data against the schema, read-only bulk scans can skip this
+        :return: The vehicle components data as a dictionary, empty on error
+        """
         data: dict[Any, Any] = {}
         filepath = os_path.join(vehicle_dir, self.vehicle_components_json_filename)
         try:
-            with open(filepath, encoding="utf-8") as file:
-                data = json_load(file)
+            data = self._read_json_file(filepath)
 
-            # Validate the loaded data against the schema
-            is_valid, error_message = self.validate_vehicle_components(data)
-            if not is_valid:
-                logging_error(_("Invalid vehicle components file '%s': %s"), filepath, error_message)
+            if validate:
+                # Validate the loaded data against the schema, memoized on the file stamp so an
+                # unchanged file is not re-validated on every load
+                is_valid, error_message = self._validate_vehicle_components_cached(data, filepath)
                 # We still return the data even if invalid for debugging purposes
+                if not is_valid and _logger.isEnabledFor(ERROR):
+                    _logger.error(_("Invalid vehicle components file '%s': %s"), filepath, error_message)
         except FileNotFoundError:
             # Normal users do not need this information
-            logging_debug(_("File '%s' not found in %s."), self.vehicle_components_json_filename, vehicle_dir)
+            if _logger.isEnabledFor(DEBUG):
+                _logger.debug(_("File '%s' not found in %s."), self.vehicle_components_json_filename, vehicle_dir)
         except JSONDecodeError:
-            logging_error(_("Error decoding JSON data from file '%s'."), filepath)
+            if _logger.isEnabledFor(ERROR):
+                _logger.error(_("Error decoding JSON data from file '%s'."), filepath)
         self.vehicle_components = data
         return data
 
-    def save_vehicle_components_json_data(self, data: dict, vehicle_dir: str) -> tuple[bool, str]:  # noqa: PLR0911 # pylint: disable=too-many-return-statements
+    # Below this size a full parse is cheaper than setting up the streaming parser
+    _PARTIAL_LOAD_THRESHOLD: ClassVar[int] = 256 * 1024
+
+    def load_components_partial(self, vehicle_dir: str) -> dict[Any, Any]:
+        """
+        Load only the "Components" subtree of a vehicle components file.
+
+        Read-only consumers such as the template overview scan do not need the other
+        top-level keys, so for large files the subtree is streamed with ijson without
+        materializing the whole document. Small files, ijson not being installed, or
+        read errors all fall back to the regular full loader.
+
+        :param vehicle_dir: The directory containing the vehicle_components.json file
+        :return: The components data as a dictionary, empty on error
+        """
+        if ijson_kvitems is not None:
+            filepath = os_path.join(vehicle_dir, self.vehicle_components_json_filename)
+            try:
+                if os_stat(filepath).st_size > self._PARTIAL_LOAD_THRESHOLD:
+                    with open(filepath, "rb") as file:
+                        return dict(ijson_kvitems(file, "Components"))
+            except (OSError, IjsonJSONError):
+                # a malformed file must not abort a whole overview scan, let the full
+                # loader below log it and continue
+                if _logger.isEnabledFor(ERROR):
+                    _logger.error(_("Error streaming JSON data from file '%s'."), filepath)
+        data = self.load_vehicle_components_json_data(vehicle_dir, validate=False)
+        return data.get("Components", {}) if data else {}
+
+    def save_vehicle_components_json_data(self, data: dict, vehicle_dir: str) -> tuple[bool, str]:
         """
         Save the vehicle components data to a JSON file.
 
@@ -156,75 +383,150 @@ class VehicleComponents:
         # is_valid, error_message = self.validate_vehicle_components(data)
         # if not is_valid:
         #     msg = _("Cannot save invalid vehicle components data: {}").format(error_message)
-        #     logging_error(msg)
+        #     _logger.error(msg)
         #     return True, msg
 
         filepath = os_path.join(vehicle_dir, self.vehicle_components_json_filename)
+        tmp_filepath = ""
         try:
-            with open(filepath, "w", encoding="utf-8", newline="\n") as file:
-                json_dump(data, file, indent=4)
-        except FileNotFoundError:
-            msg = _("Directory '{}' not found").format(vehicle_dir)
-            logging_error(msg)
-            return True, msg
-        except PermissionError:
-            msg = _("Permission denied when writing to file '{}'").format(filepath)
-            logging_error(msg)
-            return True, msg
-        except IsADirectoryError:
-            msg = _("Path '{}' is a directory, not a file").format(filepath)
-            logging_error(msg)
-            return True, msg
+            # Write to a sibling temp file and atomically rename it into place, so a crash
+            # mid-write or a concurrent reader never sees a truncated file
+            with NamedTemporaryFile(
+                mode="w",
+                dir=vehicle_dir,
+                prefix=self.vehicle_components_json_filename + ".",
+                suffix=".tmp",
+                delete=False,
+                encoding="utf-8",
+                newline="\n",
+            ) as file:
+                tmp_filepath = file.name
+                _json_dump_pretty(data, file)
+            # NamedTemporaryFile creates the file with mode 0600 and os_replace keeps it;
+            # give the final file the mode of the one it replaces (or a fresh
+            # umask-honoring default) so saving does not make user data owner-only readable
+            try:
+                file_mode = S_IMODE(os_stat(filepath).st_mode)
+            except OSError:
+                umask = os_umask(0)
+                os_umask(umask)
+                file_mode = 0o666 & ~umask
+            os_chmod(tmp_filepath, file_mode)
+            os_replace(tmp_filepath, filepath)
         except OSError as e:
-            msg = _("OS error when writing to file '{}': {}").format(filepath, str(e))
-            logging_error(msg)
-            return True, msg
-        except TypeError as e:
-            msg = _("Type error when serializing data to JSON: {}").format(str(e))
-            logging_error(msg)
+            # FileNotFoundError, PermissionError and IsADirectoryError are OSError subclasses,
+            # a single handler with a per-type message keeps the user-facing text unchanged
+            if isinstance(e, FileNotFoundError):
+                msg = _("Directory '{}' not found").format(vehicle_dir)
+            elif isinstance(e, PermissionError):
+                msg = _("Permission denied when writing to file '{}'").format(filepath)
+            elif isinstance(e, IsADirectoryError):
+                msg = _("Path '{}' is a directory, not a file").format(filepath)
+            else:
+                msg = _("OS error when writing to file '{}': {}").format(filepath, str(e))
+            _logger.error(msg)
+            self._discard_tmp_file(tmp_filepath)
             return True, msg
-        except ValueError as e:
-            msg = _("Value error when serializing data to JSON: {}").format(str(e))
-            logging_error(msg)
+        except (TypeError, ValueError) as e:
+            serialize_error_msg = (
+                _("Type error when serializing data to JSON: {}")
+                if isinstance(e, TypeError)
+                else _("Value error when serializing data to JSON: {}")
+            )
+            msg = serialize_error_msg.format(str(e))
+            _logger.error(msg)
+            self._discard_tmp_file(tmp_filepath)
             return True, msg
         except Exception as e:  # pylint: disable=broad-exception-caught
             # Still have a fallback for truly unexpected errors
             msg = _("Unexpected error saving data to file '{}': {}").format(filepath, str(e))
-            logging_error(msg)
+            _logger.error(msg)
+            self._discard_tmp_file(tmp_filepath)
             return True, msg
 
         return False, ""
 
+    @staticmethod
+    def _discard_tmp_file(tmp_filepath: str) -> None:
+        """
+        Best-effort removal of a leftover temporary file from a failed save.
+
+        :param tmp_filepath: Path of the temporary file, may be empty
+        """
+        if tmp_filepath:
+            with suppress(OSError):
+                os_remove(tmp_filepath)
+
+    def _get_fc_firmware_from_vehicle_components_json(self) -> Union[None, dict[Any, Any]]:
+        """
+        Get the "Flight Controller" -> "Firmware" sub-dictionary, None if there are no components.
+
+        :return: The firmware dictionary, or None if the components dictionary is missing or empty
+        """
+        components = self.vehicle_components.get("Components") if self.vehicle_components else None
+        if not components:
+            return None
+        firmware: dict[Any, Any] = components.get("Flight Controller", {}).get("Firmware", {})
+        return firmware
+
     def get_fc_fw_type_from_vehicle_components_json(self) -> str:
-        if self.vehicle_components and "Components" in self.vehicle_components:
-            components = self.vehicle_components["Components"]
-        else:
-            components = None
-        if components:
-            fw_type: str = components.get("Flight Controller", {}).get("Firmware", {}).get("Type", "")
-            if fw_type in self.supported_vehicles():
+        firmware = self._get_fc_firmware_from_vehicle_components_json()
+        if firmware is not None:
+            fw_type: str = firmware.get("Type", "")
+            if fw_type in self._SUPPORTED_VEHICLES_SET:
                 return fw_type
             error_msg = _("Firmware type {fw_type} in {self.vehicle_components_json_filename} is not supported")
-            logging_error(error_msg.format(**locals()))
+            _logger.error(error_msg.format(**locals()))
         return ""
 
     def get_fc_fw_version_from_vehicle_components_json(self) -> str:
-        if self.vehicle_components and "Components" in self.vehicle_components:
-            components = self.vehicle_components["Components"]
-        else:
-            components = None
-        if components:
-            version_str: str = components.get("Flight Controller", {}).get("Firmware", {}).get("Version", "")
+        firmware = self._get_fc_firmware_from_vehicle_components_json()
+        if firmware is not None:
+            version_str: str = firmware.get("Version", "")
             version_str = version_str.lstrip().split(" ")[0] if version_str else ""
-            if re_match(r"^\d+\.\d+\.\d+$", version_str):
+            if _FW_VERSION_RE.match(version_str):
                 return version_str
             error_msg = _("FW version string {version_str} on {self.vehicle_components_json_filename} is invalid")
-            logging_error(error_msg.format(**locals()))
+            _logger.error(error_msg.format(**locals()))
         return ""
 
     @staticmethod
     def supported_vehicles() -> tuple[str, ...]:
-        return ("AP_Periph", "AntennaTracker", "ArduCopter", "ArduPlane", "ArduSub", "Blimp", "Heli", "Rover", "SITL")
+        return VehicleComponents._SUPPORTED_VEHICLES
+
+    @staticmethod
+    def _find_dirs_with_file(base_dir: str, filename: str) -> list[str]:
+        """
+        Find all subdirectories of base_dir that contain a file named filename.
+
+        Uses os.scandir instead of os.walk so directory-entry type information is reused
+        instead of stat'ing every file, and prunes the search once a directory contains
+        the file, as template directories do not nest.
+
+        :param base_dir: The directory to search in
+        :param filename: The file name to search for
+        :return: A list of directories containing the file
+        """
+        found = []
+        stack = [base_dir]
+        while stack:
+            current = stack.pop()
+            subdirs = []
+            has_file = False
+            try:
+                with os_scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name == filename:
+                            has_file = True
+            except OSError:
+                continue
+            if has_file:
+                found.append(current)
+            else:
+                stack.extend(subdirs)
+        return found
 
     @staticmethod
     def get_vehicle_components_overviews() -> dict[str, TemplateOverview]:
@@ -236,20 +538,28 @@ class VehicleComponents:
 
         :return: A dictionary mapping subdirectory paths to TemplateOverview instances.
         """
-        vehicle_components_dict = {}
-        file_to_find = VehicleComponents().vehicle_components_json_filename
+        file_to_find = VehicleComponents.vehicle_components_json_filename
         template_default_dir = ProgramSettings.get_templates_base_dir()
-        for root, _dirs, files in os_walk(template_default_dir):
-            if file_to_find in files:
-                relative_path = os_path.relpath(root, template_default_dir)
-                vehicle_components = VehicleComponents()
-                comp_data = vehicle_components.load_vehicle_components_json_data(root)
-                if comp_data:
-                    comp_data = comp_data.get("Components", {})
-                    vehicle_components_overview = TemplateOverview(comp_data)
-                    vehicle_components_dict[relative_path] = vehicle_components_overview
-
-        return vehicle_components_dict
+        paths = VehicleComponents._find_dirs_with_file(template_default_dir, file_to_find)
+        if not paths:
+            return {}
+
+        def load_one(root: str) -> tuple[str, Union[None, TemplateOverview]]:
+            relative_path = os_path.relpath(root, template_default_dir)
+            # the overview is read-only, skip the costly per-template schema validation
+            # and only materialize the Components subtree for large files.
+            # A fresh instance per call keeps the workers free of shared mutable state,
+            # the schema and templates caches are module-level so this stays cheap
+            components = VehicleComponents().load_components_partial(root)
+            if components:
+                return relative_path, TemplateOverview(components)
+            return relative_path, None
+
+        # overlap the per-template file reads, the parse itself also releases the GIL with orjson
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return {
+                relative_path: overview for relative_path, overview in executor.map(load_one, paths) if overview is not None
+            }
 
     @staticmethod
     def get_vehicle_image_filepath(relative_template_path: str) -> str:
@@ -267,28 +577,34 @@ class VehicleComponents:
         if self.vehicle_components is not None:
             self._recursively_clear_dict(self.vehicle_components)
 
+    # Empty replacement value per leaf type, used as a dispatch table by _recursively_clear_dict.
+    # type() gives an exact match, so bool does not need special casing before int here
+    _CLEAR_MAP: ClassVar[dict[type, Union[int, float, bool, str]]] = {int: 0, float: 0.0, bool: False, str: ""}
+
     def _recursively_clear_dict(self, data: Union[dict, list, float, bool, str]) -> None:
         """
-        Recursively clear leaf values in a nested dictionary while preserving structure.
+        Clear leaf values in a nested dictionary while preserving structure.
+
+        Walks the tree with an explicit stack instead of recursion, so deep
+        configurations can not hit the interpreter recursion limit, and uses a
+        single exact-type dispatch per leaf instead of a chain of isinstance checks.
 
         :param data: Dictionary to clear
         """
         if not isinstance(data, dict):
             return
 
-        for key, value in data.items():
-            if isinstance(value, dict):
-                # If it's a dictionary, recurse deeper
-                self._recursively_clear_dict(value)
-            elif isinstance(value, list):
-                # If it's a list, preserve it but empty it
-                data[key] = []
-            elif isinstance(value, (int, float)):
-                # For numerical values, set to 0
-                data[key] = 0 if isinstance(value, int) else 0.0
-            elif isinstance(value, bool):
-                # For boolean values, set to False
-                data[key] = False
-            else:
-                # For strings and other types, set to empty string or None
-                data[key] = "" if isinstance(value, str) else None
+        stack: list[dict] = [data]
+        while stack:
+            current = stack.pop()
+            for key, value in current.items():
+                value_type = type(value)
+                if value_type is dict:
+                    stack.append(value)
+                elif value_type is list:
+                    # Preserve the list but empty it, a fresh list per leaf
+                    current[key] = []
+                elif value_type in self._CLEAR_MAP:
+                    current[key] = self._CLEAR_MAP[value_type]
+                else:
+                    current[key] = None
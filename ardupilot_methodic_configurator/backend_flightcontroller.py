@@ -28,9 +28,9 @@ from serial.serialutil import SerialException
 
 from ardupilot_methodic_configurator import _
 from ardupilot_methodic_configurator.annotate_params import Par
-from ardupilot_methodic_configurator.argparse_check_range import CheckRange
 from ardupilot_methodic_configurator.backend_flightcontroller_info import BackendFlightcontrollerInfo
 from ardupilot_methodic_configurator.backend_mavftp import MAVFTP
+from ardupilot_methodic_configurator.common_arguments import add_flight_controller_arguments
 
 
 class FakeSerialForTests:
@@ -574,24 +574,6 @@ class FlightController:
 
     @staticmethod
     def add_argparse_arguments(parser: ArgumentParser) -> ArgumentParser:
-        parser.add_argument(  # type: ignore[attr-defined]
-            "--device",
-            type=str,
-            default="",
-            help=_(
-                "MAVLink connection string to the flight controller. "
-                'If set to "none" no connection is made.'
-                " Default is autodetection"
-            ),
-        ).completer = lambda **_: FlightController.__list_serial_ports()  # pyright: ignore[reportAttributeAccessIssue]
-        parser.add_argument(
-            "-r",
-            "--reboot-time",
-            type=int,
-            min=5,
-            max=50,
-            action=CheckRange,
-            default=7,
-            help=_("Flight controller reboot time. Default is %(default)s"),
-        )
-        return parser
+        # the registration body lives in the lightweight common_arguments module, so the
+        # main entry point can build its parser without importing pymavlink through here
+        return add_flight_controller_arguments(parser)
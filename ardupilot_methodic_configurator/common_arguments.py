@@ -1,5 +1,5 @@
 """
-Common arguments used by all sub applications.
+Command line arguments used by the application and its sub applications.
 
 This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
 
@@ -9,10 +9,111 @@ SPDX-License-Identifier: GPL-3.0-or-later
 """
 
 from argparse import ArgumentParser
+from os import getcwd as os_getcwd
+
+from argcomplete.completers import DirectoriesCompleter
 
 from ardupilot_methodic_configurator import _, __version__
+from ardupilot_methodic_configurator.argparse_check_range import CheckRange
+from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import VehicleComponents
 from ardupilot_methodic_configurator.internationalization import LANGUAGE_CHOICES
 
+# The argument registration functions below live in this lightweight module instead of on
+# the classes that consume the arguments, so building the parser (and hence --help,
+# --version and argument-error handling) does not import the Tk stack or pymavlink.
+# The classes keep thin add_argparse_arguments delegates for their sub-application mains.
+
+
+def _list_serial_ports_completer(**_kwargs: dict) -> list:
+    """Argcomplete completer for --device, only runs inside a tab-completion subprocess."""
+    from serial.tools.list_ports import comports  # pylint: disable=import-outside-toplevel
+
+    return comports()
+
+
+def add_flight_controller_arguments(parser: ArgumentParser) -> ArgumentParser:
+    parser.add_argument(  # type: ignore[attr-defined]
+        "--device",
+        type=str,
+        default="",
+        help=_(
+            "MAVLink connection string to the flight controller. "
+            'If set to "none" no connection is made.'
+            " Default is autodetection"
+        ),
+    ).completer = _list_serial_ports_completer  # pyright: ignore[reportAttributeAccessIssue]
+    parser.add_argument(
+        "-r",
+        "--reboot-time",
+        type=int,
+        min=5,
+        max=50,
+        action=CheckRange,
+        default=7,
+        help=_("Flight controller reboot time. Default is %(default)s"),
+    )
+    return parser
+
+
+def add_filesystem_arguments(parser: ArgumentParser) -> ArgumentParser:
+    parser.add_argument(
+        "-t",
+        "--vehicle-type",
+        choices=VehicleComponents.supported_vehicles(),
+        default="",
+        help=_("The type of the vehicle. Default is ArduCopter"),
+    )
+    parser.add_argument(  # type: ignore[attr-defined]
+        "--vehicle-dir",
+        type=str,
+        default=os_getcwd(),
+        help=_("Directory containing vehicle-specific intermediate parameter files. Default is the current working directory"),
+    ).completer = DirectoriesCompleter()  # type: ignore[no-untyped-call]
+    parser.add_argument(
+        "--n",
+        type=int,
+        default=-1,
+        help=_(
+            "Start directly on the nth intermediate parameter file (skips previous files). "
+            "Default is to start on the file next to the last that you wrote to the flight controller. "
+            "If the file does not exist, it will start on the first file."
+        ),
+    )
+    parser.add_argument(
+        "--allow-editing-template-files",
+        action="store_true",
+        help=_(
+            "Allow opening and editing template files directly. "
+            "Only for software developers that know what they are doing. "
+            "Default is %(default)s"
+        ),
+    )
+    return parser
+
+
+def add_component_editor_arguments(parser: ArgumentParser) -> ArgumentParser:
+    parser.add_argument(
+        "--skip-component-editor",
+        action="store_true",
+        help=_(
+            "Skip the component editor window. Only use this if all components have been configured. Default is %(default)s"
+        ),
+    )
+    return parser
+
+
+def add_parameter_editor_arguments(parser: ArgumentParser) -> ArgumentParser:
+    return parser
+
+
+def add_update_manager_arguments(parser: ArgumentParser) -> ArgumentParser:
+    parser.add_argument(
+        "--skip-check-for-updates",
+        action="store_true",
+        help=_("Skip check for software updates before staring the software. Default is %(default)s."),
+    )
+    return parser
+
 
 def add_common_arguments(parser: ArgumentParser) -> ArgumentParser:
     parser.add_argument(
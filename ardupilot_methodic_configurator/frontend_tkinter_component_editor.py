@@ -11,16 +11,18 @@ SPDX-License-Identifier: GPL-3.0-or-later
 """
 
 import tkinter as tk
-from argparse import ArgumentParser, Namespace
 
 # from logging import debug as logging_debug
 # from logging import info as logging_info
-from logging import basicConfig as logging_basicConfig
 from logging import error as logging_error
-from logging import getLevelName as logging_getLevelName
 from math import log2
 from tkinter import ttk
-from typing import Any, Callable, Union
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+# argparse is only needed when this file is run as a script, importing it lazily keeps
+# it off the import path of the GUI code that pulls this module in
+if TYPE_CHECKING:
+    from argparse import Namespace
 
 from ardupilot_methodic_configurator import _, __version__
 from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
@@ -33,7 +35,7 @@ from ardupilot_methodic_configurator.frontend_tkinter_base import show_error_mes
 from ardupilot_methodic_configurator.frontend_tkinter_component_editor_base import ComponentEditorWindowBase
 
 
-def argument_parser() -> Namespace:
+def argument_parser() -> "Namespace":
     """
     Parses command-line arguments for the script.
 
@@ -43,6 +45,8 @@ def argument_parser() -> Namespace:
     argparse.Namespace: An object containing the parsed arguments.
 
     """
+    from argparse import ArgumentParser  # pylint: disable=import-outside-toplevel
+
     # pylint: disable=duplicate-code
     parser = ArgumentParser(
         description=_(
@@ -266,44 +270,29 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
 
     def update_json_data(self) -> None:
         super().update_json_data()
-        # To update old JSON files that do not have these new fields
-        if "Components" not in self.data:
-            self.data["Components"] = {}
-        if "Battery" not in self.data["Components"]:
-            self.data["Components"]["Battery"] = {}
-        if "Specifications" not in self.data["Components"]["Battery"]:
-            self.data["Components"]["Battery"]["Specifications"] = {}
-        if "Chemistry" not in self.data["Components"]["Battery"]["Specifications"]:
-            self.data["Components"]["Battery"]["Specifications"]["Chemistry"] = "Lipo"
-        if "Capacity mAh" not in self.data["Components"]["Battery"]["Specifications"]:
-            self.data["Components"]["Battery"]["Specifications"]["Capacity mAh"] = 0
+        # To update old JSON files that do not have these new fields.
+        # setdefault chains with local aliases traverse each subtree once instead of
+        # re-walking the nested dicts for every key check
+        components = self.data.setdefault("Components", {})
+
+        battery_specifications = components.setdefault("Battery", {}).setdefault("Specifications", {})
+        battery_specifications.setdefault("Chemistry", "Lipo")
+        battery_specifications.setdefault("Capacity mAh", 0)
 
         # To update old JSON files that do not have these new "Frame.Specifications.TOW * Kg" fields
-        if "Frame" not in self.data["Components"]:
-            self.data["Components"]["Frame"] = {}
-        if "Specifications" not in self.data["Components"]["Frame"]:
-            self.data["Components"]["Frame"]["Specifications"] = {}
-        if "TOW min Kg" not in self.data["Components"]["Frame"]["Specifications"]:
-            self.data["Components"]["Frame"]["Specifications"]["TOW min Kg"] = 1
-        if "TOW max Kg" not in self.data["Components"]["Frame"]["Specifications"]:
-            self.data["Components"]["Frame"]["Specifications"]["TOW max Kg"] = 1
+        frame_specifications = components.setdefault("Frame", {}).setdefault("Specifications", {})
+        frame_specifications.setdefault("TOW min Kg", 1)
+        frame_specifications.setdefault("TOW max Kg", 1)
 
         # Older versions used receiver instead of Receiver, rename it for consistency with other fields
-        if "GNSS receiver" in self.data["Components"]:
-            self.data["Components"]["GNSS Receiver"] = self.data["Components"].pop("GNSS receiver")
+        if "GNSS receiver" in components:
+            components["GNSS Receiver"] = components.pop("GNSS receiver")
 
         self.data["Program version"] = __version__
 
-        # To update old JSON files that do not have this new "Flight Controller.Specifications.MCU Series" field
-        if "Flight Controller" not in self.data["Components"]:
-            self.data["Components"]["Flight Controller"] = {}
-        if "Specifications" not in self.data["Components"]["Flight Controller"]:
-            self.data["Components"]["Flight Controller"] = {
-                "Product": self.data["Components"]["Flight Controller"]["Product"],
-                "Firmware": self.data["Components"]["Flight Controller"]["Firmware"],
-                "Specifications": {"MCU Series": "Unknown"},
-                "Notes": self.data["Components"]["Flight Controller"]["Notes"],
-            }
+        # To update old JSON files that do not have this new "Flight Controller.Specifications.MCU Series" field.
+        # Unlike the previous dict rebuild, this keeps any other Flight Controller fields intact
+        components.setdefault("Flight Controller", {}).setdefault("Specifications", {"MCU Series": "Unknown"})
 
     def set_vehicle_type_and_version(self, vehicle_type: str, version: str) -> None:
         self._set_component_value_and_update_ui(("Flight Controller", "Firmware", "Type"), vehicle_type)
@@ -659,11 +648,12 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
     def validate_cell_voltage(self, event: Union[None, tk.Event], entry: ttk.Entry, path: tuple[str, str, str]) -> bool:  # pylint: disable=too-many-branches
         """Validates the value of a battery cell voltage entry."""
         chemistry_path = ("Battery", "Specifications", "Chemistry")
-        if chemistry_path not in self.entry_widgets:
+        chemistry_entry = self._get_entry_widget(chemistry_path)
+        if chemistry_entry is None:
             show_error_message(_("Error"), _("Battery Chemistry not set. Will default to Lipo."))
             chemistry = "Lipo"
         else:
-            chemistry = self.entry_widgets[chemistry_path].get()
+            chemistry = chemistry_entry.get()
         value = entry.get()
         is_focusout_event = event and event.type == "10"
         _path_str = ">".join(list(path))
@@ -714,6 +704,8 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
             super().validate_and_save_component_json()
 
     def validate_data(self) -> bool:  # pylint: disable=too-many-branches
+        # Validation compares entries against each other, so all leaves must exist
+        self._materialize_all_pending()
         invalid_values = False
         duplicated_connections = False
         fc_serial_connection: dict[str, str] = {}
@@ -785,6 +777,9 @@ class ComponentEditorWindow(ComponentEditorWindowBase):
 
 
 if __name__ == "__main__":
+    from logging import basicConfig as logging_basicConfig
+    from logging import getLevelName as logging_getLevelName
+
     args = argument_parser()
 
     logging_basicConfig(level=logging_getLevelName(args.loglevel), format="%(asctime)s - %(levelname)s - %(message)s")
@@ -1,417 +1,712 @@
-#!/usr/bin/env python3
-
-"""
-Component editor GUI that is not data dependent.
-
-This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
-
-SPDX-FileCopyrightText: 2024-2025 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
-
-SPDX-License-Identifier: GPL-3.0-or-later
-"""
-
-import tkinter as tk
-from argparse import ArgumentParser, Namespace
-
-# from logging import debug as logging_debug
-from logging import basicConfig as logging_basicConfig
-from logging import getLevelName as logging_getLevelName
-from logging import info as logging_info
-from sys import exit as sys_exit
-from tkinter import Menu, messagebox, simpledialog, ttk
-from typing import Union
-
-from ardupilot_methodic_configurator import _, __version__
-from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
-from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import VehicleComponents
-from ardupilot_methodic_configurator.common_arguments import add_common_arguments
-from ardupilot_methodic_configurator.frontend_tkinter_base import (
-    BaseWindow,
-    RichText,
-    ScrollFrame,
-    UsagePopupWindow,
-    show_error_message,
-    show_tooltip,
-)
-
-
-def argument_parser() -> Namespace:
-    """
-    Parses command-line arguments for the script.
-
-    This function sets up an argument parser to handle the command-line arguments for the script.
-
-    Returns:
-    argparse.Namespace: An object containing the parsed arguments.
-
-    """
-    # pylint: disable=duplicate-code
-    parser = ArgumentParser(
-        description=_(
-            "A GUI for editing JSON files that contain vehicle component configurations. "
-            "Not to be used directly, but through the main ArduPilot methodic configurator script."
-        )
-    )
-    parser = LocalFilesystem.add_argparse_arguments(parser)
-    parser = ComponentEditorWindowBase.add_argparse_arguments(parser)
-    return add_common_arguments(parser).parse_args()
-    # pylint: enable=duplicate-code
-
-
-class ComponentEditorWindowBase(BaseWindow):
-    """
-    A class for editing JSON files in the ArduPilot methodic configurator.
-
-    This class provides a graphical user interface for editing JSON files that
-    contain vehicle component configurations. It inherits from the BaseWindow
-    class, which provides basic window functionality.
-    """
-
-    def __init__(self, version: str, local_filesystem: LocalFilesystem) -> None:
-        super().__init__()
-        self.local_filesystem = local_filesystem
-
-        self.root.title(_("Amilcar Lucas's - ArduPilot methodic configurator ") + version + _(" - Vehicle Component Editor"))
-        self.root.geometry("880x600")  # Set the window width
-
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-
-        self.data = local_filesystem.load_vehicle_components_json_data(local_filesystem.vehicle_dir)
-        if len(self.data) < 1:
-            # Schedule the window to be destroyed after the mainloop has started
-            self.root.after(100, self.root.destroy)  # Adjust the delay as needed
-            return
-
-        self.entry_widgets: dict[tuple, Union[ttk.Entry, ttk.Combobox]] = {}
-
-        intro_frame = ttk.Frame(self.main_frame)
-        intro_frame.pack(side=tk.TOP, fill="x", expand=False)
-
-        style = ttk.Style()
-        style.configure("bigger.TLabel", font=("TkDefaultFont", 14))
-        style.configure("comb_input_invalid.TCombobox", fieldbackground="red")
-        style.configure("comb_input_valid.TCombobox", fieldbackground="white")
-        style.configure("entry_input_invalid.TEntry", fieldbackground="red")
-        style.configure("entry_input_valid.TEntry", fieldbackground="white")
-
-        explanation_text = _("Please configure all vehicle component properties in this window.\n")
-        explanation_text += _("Scroll down and make sure you do not miss a property.\n")
-        explanation_text += _("Saving the result will write to the vehicle_components.json file.")
-        explanation_label = ttk.Label(intro_frame, text=explanation_text, wraplength=800, justify=tk.LEFT)
-        explanation_label.configure(style="bigger.TLabel")
-        explanation_label.pack(side=tk.LEFT, padx=(10, 10), pady=(10, 0), anchor=tk.NW)
-
-        # Load the vehicle image and scale it down to image_height pixels in height
-        if local_filesystem.vehicle_image_exists():
-            image_label = self.put_image_in_label(intro_frame, local_filesystem.vehicle_image_filepath(), 100)
-            image_label.pack(side=tk.RIGHT, anchor=tk.NE, padx=(4, 4), pady=(4, 0))
-            show_tooltip(image_label, _("Replace the vehicle.jpg file in the vehicle directory to change the vehicle image."))
-        else:
-            image_label = ttk.Label(intro_frame, text=_("Add a 'vehicle.jpg' image file to the vehicle directory."))
-            image_label.pack(side=tk.RIGHT, anchor=tk.NE, padx=(4, 4), pady=(4, 0))
-
-        self.scroll_frame = ScrollFrame(self.main_frame)
-        self.scroll_frame.pack(side="top", fill="both", expand=True)
-
-        self.update_json_data()
-
-        save_frame = ttk.Frame(self.main_frame)
-        save_frame.pack(side=tk.TOP, fill="x", expand=False)
-        self.save_button = ttk.Button(
-            save_frame, text=_("Save data and start configuration"), command=self.validate_and_save_component_json
-        )
-        show_tooltip(self.save_button, _("Save component data and start parameter value configuration and tuning."))
-        self.save_button.pack(pady=7)
-        if UsagePopupWindow.should_display("component_editor"):
-            self.root.after(10, self.__display_component_editor_usage_instructions(self.root))  # type: ignore[arg-type]
-
-        self.template_controls = {"buttons": {}, "current_menu": None, "manager": VehicleComponents()}
-
-    @staticmethod
-    def __display_component_editor_usage_instructions(parent: tk.Toplevel) -> None:
-        usage_popup_window = BaseWindow(parent)
-        style = ttk.Style()
-
-        instructions_text = RichText(
-            usage_popup_window.main_frame, wrap=tk.WORD, height=5, bd=0, background=style.lookup("TLabel", "background")
-        )
-        instructions_text.insert(tk.END, _("1. Describe all vehicle component properties in the window below\n"))
-        instructions_text.insert(tk.END, _("2. Scroll all the way down and make sure to edit all properties\n"))
-        instructions_text.insert(tk.END, _("3. Do not be lazy, collect the required information and enter it\n"))
-        instructions_text.insert(tk.END, _("4. Press the "))
-        instructions_text.insert(tk.END, _("Save data and start configuration"), "italic")
-        instructions_text.insert(tk.END, _(" only after all information is correct"))
-        instructions_text.config(state=tk.DISABLED)
-
-        UsagePopupWindow.display(
-            parent,
-            usage_popup_window,
-            _("How to use the component editor window"),
-            "component_editor",
-            "690x200",
-            instructions_text,
-        )
-
-    def update_json_data(self) -> None:  # should be overwritten in child classes
-        if "Format version" not in self.data:
-            self.data["Format version"] = 1
-
-    def _set_component_value_and_update_ui(self, path: tuple, value: str) -> None:
-        data_path = self.data["Components"]
-        for key in path[:-1]:
-            data_path = data_path[key]
-        data_path[path[-1]] = value
-        entry = self.entry_widgets[path]
-        entry.delete(0, tk.END)
-        entry.insert(0, value)
-        entry.config(state="disabled")
-
-    def populate_frames(self) -> None:
-        """Populates the ScrollFrame with widgets based on the JSON data."""
-        if "Components" in self.data:
-            for key, value in self.data["Components"].items():
-                self.__add_widget(self.scroll_frame.view_port, key, value, [])
-
-    def __add_widget(self, parent: tk.Widget, key: str, value: dict, path: list) -> None:
-        """
-        Adds a widget to the parent widget with the given key and value.
-
-        Args:
-            parent (tkinter.Widget): The parent widget to which the LabelFrame/Entry will be added.
-            key (str): The key for the LabelFrame/Entry.
-            value (dict): The value associated with the key.
-            path (list): The path to the current key in the JSON data.
-
-        """
-        if isinstance(value, dict):  # JSON non-leaf elements, add LabelFrame widget
-            frame = ttk.LabelFrame(parent, text=_(key))
-            is_toplevel = parent == self.scroll_frame.view_port
-            pady = 5 if is_toplevel else 3
-            frame.pack(
-                fill=tk.X, side=tk.TOP if is_toplevel else tk.LEFT, pady=pady, padx=5, anchor=tk.NW if is_toplevel else tk.N
-            )
-            if is_toplevel and key in self.data.get("Components", {}):
-                self._add_template_controls(frame, key)
-
-            for sub_key, sub_value in value.items():
-                # recursively add child elements
-                self.__add_widget(frame, sub_key, sub_value, [*path, key])
-        else:  # JSON leaf elements, add Entry widget
-            entry_frame = ttk.Frame(parent)
-            entry_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
-
-            label = ttk.Label(entry_frame, text=_(key))
-            label.pack(side=tk.LEFT)
-
-            entry = self.add_entry_or_combobox(value, entry_frame, (*path, key))
-            entry.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
-
-            # Store the entry widget in the entry_widgets dictionary for later retrieval
-            self.entry_widgets[(*path, key)] = entry
-
-    def _add_template_controls(self, parent_frame: ttk.LabelFrame, component_name: str) -> None:
-        """Add template dropdown and save buttons for a component."""
-        label_frame = ttk.Frame(parent_frame)
-        label_frame.pack(side=tk.TOP, fill=tk.X)
-
-        label = ttk.Label(label_frame, text=_("Template:"))
-        label.pack(side=tk.LEFT, padx=(5, 5))
-
-        # Create and add the dropdown button
-        dropdown_button = ttk.Button(
-            label_frame, text="▼", width=2, command=lambda k=component_name: self.show_template_options(k)
-        )
-        show_tooltip(dropdown_button, _("Select a template for this component"))
-        dropdown_button.pack(side=tk.LEFT)
-
-        # Create and add the save template button
-        save_button = ttk.Button(
-            label_frame, text="+", width=2, command=lambda k=component_name: self.save_component_as_template(k)
-        )
-        show_tooltip(save_button, _("Save current configuration as template"))
-        save_button.pack(side=tk.LEFT, padx=(5, 0))
-
-        # Store the dropdown button reference
-        self.template_controls["buttons"][component_name] = dropdown_button
-
-    def save_component_as_template(self, component_name: str) -> None:
-        """Save the current component configuration as a template."""
-        component_data = self.data["Components"].get(component_name, {})
-        if not component_data:
-            messagebox.showerror(_("Error"), _("No data for component: ") + component_name)
-            return
-        template_name = simpledialog.askstring(_("Save Template"), _("Enter a name for this template:"), parent=self.root)
-        if not template_name:
-            return
-
-        templates = self.template_controls["manager"].load_component_templates()
-        if component_name not in templates:
-            templates[component_name] = []
-
-        new_template = {"name": template_name, "data": component_data}
-
-        for i, template in enumerate(templates[component_name]):
-            if template.get("name") == template_name:
-                confirm = messagebox.askyesno(_("Template exists"), _("A template with this name already exists. Overwrite?"))
-                if confirm:
-                    templates[component_name][i] = new_template
-                    self.template_controls["manager"].save_component_templates(templates)
-                    messagebox.showinfo(_("Template Saved"), _("Template has been updated"))
-                return
-
-        templates[component_name].append(new_template)
-        self.template_controls["manager"].save_component_templates(templates)
-        messagebox.showinfo(_("Template Saved"), _("Template has been saved"))
-
-    def create_template_dropdown_button(self, parent: ttk.Frame, component_name: str) -> ttk.Button:
-        """Creates a dropdown button for component templates."""
-        button = ttk.Button(parent, text="▼", width=2, command=lambda: self.show_template_options(component_name))
-        show_tooltip(button, _("Select a template for this component"))
-        return button
-
-    def show_template_options(self, component_name: str) -> None:
-        """Shows a dropdown menu with template options for the component."""
-        if hasattr(self, "current_dropdown_menu") and self.template_controls["current_menu"]:
-            self.template_controls["current_menu"].unpost()
-
-        button = self.template_controls["buttons"].get(component_name)
-        if not button:
-            return
-
-        templates = self.template_controls["manager"].load_component_templates()
-        component_templates = templates.get(component_name, [])
-
-        menu = Menu(self.root, tearoff=0)
-
-        if component_templates:
-            for template in component_templates:
-                template_name = template.get("name", "Template")
-                menu.add_command(
-                    label=template_name, command=lambda t=template, c=component_name: self.apply_component_template(c, t)
-                )
-        else:
-            menu.add_command(label=_("No templates available"), state="disabled")
-
-        x = button.winfo_rootx()
-        y = button.winfo_rooty() + button.winfo_height()
-        menu.post(x, y)
-
-        self.template_controls["current_menu"] = menu
-
-        def close_menu(_: tk.Event) -> None:
-            if hasattr(self, "current_dropdown_menu") and self.template_controls["current_menu"]:
-                self.template_controls["current_menu"].unpost()
-                self.template_controls["current_menu"] = None
-                self.root.unbind("<Button-1>", close_handler_id)
-
-        close_handler_id = self.root.bind("<Button-1>", close_menu, add="+")
-
-    def apply_component_template(self, component_name: str, template: dict) -> None:
-        """Apply a template to a component."""
-        if "data" not in template:
-            return
-
-        template_data = template["data"]
-        self.data["Components"][component_name] = template_data
-
-        for path, entry in self.entry_widgets.items():
-            if len(path) >= 1 and path[0] == component_name:
-                value = template_data
-                try:
-                    for key in path[1:]:
-                        value = value[key]
-                    entry.delete(0, tk.END)
-                    entry.insert(0, str(value))
-                except (KeyError, TypeError):
-                    pass
-
-        template_name = template.get("name", "Template")
-        messagebox.showinfo(_("Template Applied"), _("{} has been applied to {}").format(template_name, component_name))
-
-    def validate_and_save_component_json(self) -> None:
-        """Saves the edited JSON data back to the file."""
-        confirm_message = _(
-            "ArduPilot Methodic Configurator only operates correctly if all component properties are correct."
-            " ArduPilot parameter values depend on the components used and their connections.\n\n"
-            " Have you used the scrollbar on the right side of the window and "
-            "entered the correct values for all components?"
-        )
-        user_confirmation = messagebox.askyesno(_("Confirm that all component properties are correct"), confirm_message)
-
-        if not user_confirmation:
-            # User chose 'No', so return and do not save data
-            return
-
-        self.save_component_json()
-
-    def save_component_json(self) -> None:
-        # User confirmed, proceed with saving the data
-        for path, entry in self.entry_widgets.items():
-            value: Union[str, int, float] = entry.get()
-            # Navigate through the nested dictionaries using the elements of the path
-            current_data = self.data["Components"]
-            for key in path[:-1]:
-                current_data = current_data[key]
-
-            if path[-1] != "Version":
-                try:
-                    value = int(value)
-                except ValueError:
-                    try:
-                        value = float(value)
-                    except ValueError:
-                        value = str(value).strip()
-
-            # Update the value in the data dictionary
-            current_data[path[-1]] = value
-
-        # Save the updated data back to the JSON file
-        failed, msg = self.local_filesystem.save_vehicle_components_json_data(self.data, self.local_filesystem.vehicle_dir)
-        if failed:
-            show_error_message(_("Error"), _("Failed to save data to file.") + "\n" + msg)
-        else:
-            logging_info(_("Vehicle component data saved successfully."))
-        self.root.destroy()
-
-    def on_closing(self) -> None:
-        """Handle window closing event."""
-        answer = messagebox.askyesnocancel(_("Save Changes?"), _("Do you want to save the changes before closing?"))
-
-        if answer is None:  # Cancel was clicked
-            return
-
-        if answer:
-            self.save_component_json()
-        else:
-            self.root.destroy()
-        sys_exit(0)
-
-    # This function will be overwritten in child classes
-    def add_entry_or_combobox(
-        self, value: float, entry_frame: ttk.Frame, _path: tuple[str, str, str]
-    ) -> Union[ttk.Entry, ttk.Combobox]:
-        entry = ttk.Entry(entry_frame)
-        entry.insert(0, str(value))
-        return entry
-
-    @staticmethod
-    def add_argparse_arguments(parser: ArgumentParser) -> ArgumentParser:
-        parser.add_argument(
-            "--skip-component-editor",
-            action="store_true",
-            help=_(
-                "Skip the component editor window. Only use this if all components have been configured. "
-                "Default is %(default)s"
-            ),
-        )
-        return parser
-
-
-if __name__ == "__main__":
-    args = argument_parser()
-
-    logging_basicConfig(level=logging_getLevelName(args.loglevel), format="%(asctime)s - %(levelname)s - %(message)s")
-
-    filesystem = LocalFilesystem(args.vehicle_dir, args.vehicle_type, "", args.allow_editing_template_files)
-    app = ComponentEditorWindowBase(__version__, filesystem)
-    app.root.mainloop()
\ No newline at end of file
+#!/usr/bin/env python3
+
+"""
+Component editor GUI that is not data dependent.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024-2025 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import tkinter as tk
+from collections import deque
+
+# from logging import debug as logging_debug
+from logging import info as logging_info
+from platform import system as platform_system
+from re import compile as re_compile
+from sys import exit as sys_exit
+from tkinter import Menu, messagebox, simpledialog, ttk
+from typing import TYPE_CHECKING, Any, Union
+from weakref import WeakKeyDictionary
+
+# argparse is only needed when this file is run as a script, importing it lazily keeps
+# it off the import path of the GUI code that pulls this module in
+if TYPE_CHECKING:
+    from argparse import ArgumentParser, Namespace
+
+from ardupilot_methodic_configurator import _, __version__
+from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
+from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import VehicleComponents
+from ardupilot_methodic_configurator.common_arguments import add_common_arguments, add_component_editor_arguments
+from ardupilot_methodic_configurator.frontend_tkinter_base import (
+    BaseWindow,
+    RichText,
+    ScrollFrame,
+    UsagePopupWindow,
+    show_error_message,
+)
+
+# Classify entry strings as int or float up-front, most component fields are plain
+# strings and raising/catching ValueError for each of them is expensive.
+# The patterns accept everything int()/float() accept apart from inf/nan,
+# including leading +, ".5"-style fractions and digit-group underscores
+_INT_RE = re_compile(r"^[+-]?\d+(_\d+)*$")
+_FLOAT_RE = re_compile(r"^[+-]?(\d+(_\d+)*(\.(\d+(_\d+)*)?)?|\.\d+(_\d+)*)([eE][+-]?\d+(_\d+)*)?$")
+
+
+def _coerce_value(value: str) -> Union[str, int, float]:
+    """Convert an entry string to int or float when it looks numeric, strip it otherwise."""
+    stripped = value.strip()
+    if _INT_RE.match(stripped):
+        return int(stripped)
+    if _FLOAT_RE.match(stripped):
+        return float(stripped)
+    return stripped
+
+
+def argument_parser() -> "Namespace":
+    """
+    Parses command-line arguments for the script.
+
+    This function sets up an argument parser to handle the command-line arguments for the script.
+
+    Returns:
+    argparse.Namespace: An object containing the parsed arguments.
+
+    """
+    from argparse import ArgumentParser  # pylint: disable=import-outside-toplevel
+
+    # pylint: disable=duplicate-code
+    parser = ArgumentParser(
+        description=_(
+            "A GUI for editing JSON files that contain vehicle component configurations. "
+            "Not to be used directly, but through the main ArduPilot methodic configurator script."
+        )
+    )
+    parser = LocalFilesystem.add_argparse_arguments(parser)
+    parser = ComponentEditorWindowBase.add_argparse_arguments(parser)
+    return add_common_arguments(parser).parse_args()
+    # pylint: enable=duplicate-code
+
+
+class ComponentEditorWindowBase(BaseWindow):
+    """
+    A class for editing JSON files in the ArduPilot methodic configurator.
+
+    This class provides a graphical user interface for editing JSON files that
+    contain vehicle component configurations. It inherits from the BaseWindow
+    class, which provides basic window functionality.
+    """
+
+    # Feature flag: represent the JSON leaves in a single Treeview widget instead of one
+    # Entry widget per leaf. One C-level Treeview shows large component trees much faster
+    # than thousands of packed widgets, at the cost of in-place editing ergonomics.
+    use_treeview = False
+
+    def __init__(self, version: str, local_filesystem: LocalFilesystem) -> None:
+        super().__init__()
+        self.local_filesystem = local_filesystem
+
+        self.root.title(_("Amilcar Lucas's - ArduPilot methodic configurator ") + version + _(" - Vehicle Component Editor"))
+        self.root.geometry("880x600")  # Set the window width
+
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+        # One shared tooltip window driven by a single <Motion> binding on the root
+        # replaces a Toplevel and an <Enter>/<Leave> binding pair per widget
+        self._tooltips: WeakKeyDictionary = WeakKeyDictionary()
+        self._tooltip_window: Union[None, tk.Toplevel] = None
+        self._tooltip_label: Union[None, ttk.Label] = None
+        self._tooltip_widget: Union[None, tk.Widget] = None
+        self.root.bind("<Motion>", self._tooltip_tick, add="+")
+
+        self.data = local_filesystem.load_vehicle_components_json_data(local_filesystem.vehicle_dir)
+        if len(self.data) < 1:
+            # Schedule the window to be destroyed after the mainloop has started
+            self.root.after(100, self.root.destroy)  # Adjust the delay as needed
+            return
+
+        self.entry_widgets: dict[tuple, Union[ttk.Entry, ttk.Combobox]] = {}
+        # (parent dict, leaf key) per entry path, so value updates do not re-walk the
+        # nested Components dicts for every widget
+        self.entry_parents: dict[tuple, tuple[dict, str]] = {}
+        # Leaves whose Entry widget has not been created yet, see __add_widgets: only a
+        # cheap placeholder label exists until the leaf scrolls into view
+        self._pending_leaves: dict[tuple, tuple[ttk.Frame, ttk.Label, Any]] = {}
+
+        self.__create_intro_frame()
+
+        self.scroll_frame = ScrollFrame(self.main_frame)
+        self.scroll_frame.pack(side="top", fill="both", expand=True)
+
+        self.update_json_data()
+
+        save_frame = ttk.Frame(self.main_frame)
+        save_frame.pack(side=tk.TOP, fill="x", expand=False)
+        self.save_button = ttk.Button(
+            save_frame, text=_("Save data and start configuration"), command=self.validate_and_save_component_json
+        )
+        self._register_tooltip(self.save_button, _("Save component data and start parameter value configuration and tuning."))
+        self.save_button.pack(pady=7)
+        if UsagePopupWindow.should_display("component_editor"):
+            self.root.after(10, self.__display_component_editor_usage_instructions(self.root))  # type: ignore[arg-type]
+
+        # The templates file is read once here and cached, so opening a template dropdown
+        # does not re-read and re-parse it on every click
+        manager = VehicleComponents()
+        self.template_controls = {
+            "buttons": {},
+            "current_menu": None,
+            "manager": manager,
+            "cache": manager.load_component_templates(),
+        }
+        # One persistent menu shared by all template dropdowns, cleared and repopulated
+        # per click instead of constructing a fresh Tk Menu every time.
+        # tk_popup's pointer grab dismisses the menu on an outside click; <Unmap> fires once
+        # when that happens, unlike a global <Button-1> bind that would run on every click
+        self._template_menu = Menu(self.root, tearoff=0)
+        self._template_menu.bind("<Unmap>", lambda _event: self.template_controls.update(current_menu=None))
+
+    def __create_intro_frame(self) -> None:
+        """Create the explanation text and vehicle image shown above the component widgets."""
+        intro_frame = ttk.Frame(self.main_frame)
+        intro_frame.pack(side=tk.TOP, fill="x", expand=False)
+
+        # ttk styles are global per Tk interpreter (each BaseWindow without a parent
+        # creates its own), so configure them only when this interpreter lacks them
+        style = ttk.Style(self.root)
+        if not style.configure("entry_input_invalid.TEntry"):
+            style.configure("bigger.TLabel", font=("TkDefaultFont", 14))
+            style.configure("comb_input_invalid.TCombobox", fieldbackground="red")
+            style.configure("comb_input_valid.TCombobox", fieldbackground="white")
+            style.configure("entry_input_invalid.TEntry", fieldbackground="red")
+            style.configure("entry_input_valid.TEntry", fieldbackground="white")
+
+        explanation_text = _("Please configure all vehicle component properties in this window.\n")
+        explanation_text += _("Scroll down and make sure you do not miss a property.\n")
+        explanation_text += _("Saving the result will write to the vehicle_components.json file.")
+        explanation_label = ttk.Label(intro_frame, text=explanation_text, wraplength=800, justify=tk.LEFT)
+        explanation_label.configure(style="bigger.TLabel")
+        explanation_label.pack(side=tk.LEFT, padx=(10, 10), pady=(10, 0), anchor=tk.NW)
+
+        # Load the vehicle image and scale it down to image_height pixels in height
+        if self.local_filesystem.vehicle_image_exists():
+            image_label = self.put_image_in_label(intro_frame, self.local_filesystem.vehicle_image_filepath(), 100)
+            image_label.pack(side=tk.RIGHT, anchor=tk.NE, padx=(4, 4), pady=(4, 0))
+            self._register_tooltip(
+                image_label, _("Replace the vehicle.jpg file in the vehicle directory to change the vehicle image.")
+            )
+        else:
+            image_label = ttk.Label(intro_frame, text=_("Add a 'vehicle.jpg' image file to the vehicle directory."))
+            image_label.pack(side=tk.RIGHT, anchor=tk.NE, padx=(4, 4), pady=(4, 0))
+
+    @staticmethod
+    def __display_component_editor_usage_instructions(parent: tk.Toplevel) -> None:
+        usage_popup_window = BaseWindow(parent)
+        style = ttk.Style()
+
+        instructions_text = RichText(
+            usage_popup_window.main_frame, wrap=tk.WORD, height=5, bd=0, background=style.lookup("TLabel", "background")
+        )
+        instructions_text.insert(tk.END, _("1. Describe all vehicle component properties in the window below\n"))
+        instructions_text.insert(tk.END, _("2. Scroll all the way down and make sure to edit all properties\n"))
+        instructions_text.insert(tk.END, _("3. Do not be lazy, collect the required information and enter it\n"))
+        instructions_text.insert(tk.END, _("4. Press the "))
+        instructions_text.insert(tk.END, _("Save data and start configuration"), "italic")
+        instructions_text.insert(tk.END, _(" only after all information is correct"))
+        instructions_text.config(state=tk.DISABLED)
+
+        UsagePopupWindow.display(
+            parent,
+            usage_popup_window,
+            _("How to use the component editor window"),
+            "component_editor",
+            "690x200",
+            instructions_text,
+        )
+
+    def _register_tooltip(self, widget: tk.Widget, text: str) -> None:
+        """Register tooltip text for a widget with the shared tooltip manager."""
+        self._tooltips[widget] = text
+
+    def _tooltip_tick(self, event: tk.Event) -> None:
+        """Show or hide the shared tooltip window based on the widget under the cursor."""
+        widget = self.root.winfo_containing(event.x_root, event.y_root)
+        if widget is self._tooltip_widget:
+            return
+        self._tooltip_widget = widget
+        text = self._tooltips.get(widget) if widget is not None else None
+        if text is None:
+            if self._tooltip_window is not None:
+                self._tooltip_window.withdraw()
+            return
+        self._show_shared_tooltip(widget, text)
+
+    def _show_shared_tooltip(self, widget: tk.Widget, text: str) -> None:
+        """Position and show the shared tooltip window below the widget."""
+        if self._tooltip_window is None:
+            tooltip = tk.Toplevel(self.root)
+            if platform_system() == "Darwin":  # macOS
+                try:
+                    tooltip.tk.call(
+                        "::tk::unsupported::MacWindowStyle",
+                        "style",
+                        tooltip._w,  # type: ignore[attr-defined] # noqa: SLF001 # pylint: disable=protected-access
+                        "help",
+                        "noActivates",
+                    )
+                    tooltip.configure(bg="#ffffe0")
+                except AttributeError:  # Catches protected member access error
+                    tooltip.wm_attributes("-alpha", 1.0)  # Ensure opacity
+                    tooltip.wm_attributes("-topmost", True)  # Keep on top # noqa: FBT003
+                    tooltip.configure(bg="#ffffe0")
+            else:
+                tooltip.wm_overrideredirect(boolean=True)
+            self._tooltip_label = ttk.Label(
+                tooltip, text=text, background="#ffffe0", relief="solid", borderwidth=1, justify=tk.LEFT
+            )
+            self._tooltip_label.pack()
+            tooltip.withdraw()
+            self._tooltip_window = tooltip
+        self._tooltip_label.config(text=text)  # type: ignore[union-attr]
+        x = widget.winfo_rootx() + min(widget.winfo_width() // 2, 100)
+        y = widget.winfo_rooty() + widget.winfo_height()
+        self._tooltip_window.geometry(f"+{x}+{y}")
+        self._tooltip_window.deiconify()
+
+    def update_json_data(self) -> None:  # should be overwritten in child classes
+        if "Format version" not in self.data:
+            self.data["Format version"] = 1
+
+    def _get_parent_and_leaf(self, path: tuple) -> tuple[dict, str]:
+        """Return the dict holding the leaf value of path, walking the data only on a cache miss."""
+        parent_and_leaf = self.entry_parents.get(path)
+        if parent_and_leaf is None:
+            data_path = self.data["Components"]
+            for key in path[:-1]:
+                data_path = data_path[key]
+            parent_and_leaf = (data_path, path[-1])
+            self.entry_parents[path] = parent_and_leaf
+        return parent_and_leaf
+
+    def _set_component_value_and_update_ui(self, path: tuple, value: str) -> None:
+        parent_data, leaf_key = self._get_parent_and_leaf(path)
+        parent_data[leaf_key] = value
+        entry = self.entry_widgets[path] if path in self.entry_widgets else self._materialize_pending(path)
+        entry.delete(0, tk.END)
+        entry.insert(0, value)
+        entry.config(state="disabled")
+
+    def populate_frames(self) -> None:
+        """Populates the ScrollFrame with widgets based on the JSON data."""
+        if "Components" not in self.data:
+            return
+        # Hide the window while the widgets are built, so Tk collapses the geometry
+        # recalculations into a single relayout pass instead of one per packed widget
+        self.root.withdraw()
+        if self.use_treeview:
+            self._populate_treeview()
+        else:
+            self.__add_widgets()
+        self.root.update_idletasks()
+        self.root.deiconify()
+
+    def _populate_treeview(self) -> None:
+        """Represent the component tree in a single Treeview widget with in-place editing."""
+        tree = ttk.Treeview(self.scroll_frame.view_port, columns=("value",), show="tree headings")
+        tree.heading("#0", text=_("Property"))
+        tree.heading("value", text=_("Value"))
+        tree.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+
+        # Leaf values keyed on path, the Treeview equivalent of the entry_widgets dict
+        self.tree_values: dict[tuple, str] = {}
+        self._tree_paths: dict[str, tuple] = {}
+
+        # Walk the tree with an explicit stack, recursion is not needed here
+        stack: list[tuple[str, dict, tuple, str]] = [
+            (key, value, (), "") for key, value in reversed(self.data["Components"].items())
+        ]
+        while stack:
+            key, value, path, parent_iid = stack.pop()
+            node_path = (*path, key)
+            if isinstance(value, dict):
+                iid = tree.insert(parent_iid, tk.END, text=_(key), open=True)
+                stack.extend((sub_key, sub_value, node_path, iid) for sub_key, sub_value in reversed(value.items()))
+            else:
+                iid = tree.insert(parent_iid, tk.END, text=_(key), values=(value,))
+                self.tree_values[node_path] = str(value)
+                self._tree_paths[iid] = node_path
+
+        tree.bind("<Double-1>", self._on_treeview_double_click)
+        self._tree = tree
+        # A single Entry is reused as edit overlay for all cells
+        self._tree_edit_entry: Union[None, ttk.Entry] = None
+        self._tree_edit_iid: Union[None, str] = None
+
+    def _on_treeview_double_click(self, event: tk.Event) -> None:
+        """Overlay the reusable edit Entry on the double-clicked leaf cell."""
+        iid = self._tree.identify_row(event.y)
+        node_path = self._tree_paths.get(iid)
+        if node_path is None:  # non-leaf rows are not editable
+            return
+        bbox = self._tree.bbox(iid, "value")
+        if not bbox:
+            return
+        x, y, width, height = bbox
+
+        entry = self._tree_edit_entry
+        if entry is None:
+            entry = ttk.Entry(self._tree)
+            entry.bind("<Return>", self._commit_treeview_edit)
+            entry.bind("<FocusOut>", self._commit_treeview_edit)
+            self._tree_edit_entry = entry
+        entry.place(x=x, y=y, width=width, height=height)
+        entry.delete(0, tk.END)
+        entry.insert(0, self.tree_values[node_path])
+        entry.focus_set()
+        self._tree_edit_iid = iid
+
+    def _commit_treeview_edit(self, _event: tk.Event) -> None:
+        """Write the edit Entry contents back into the Treeview, tree_values and data."""
+        entry = self._tree_edit_entry
+        iid = self._tree_edit_iid
+        if entry is None or iid is None:
+            return
+        self._tree_edit_iid = None
+
+        node_path = self._tree_paths[iid]
+        value: Union[str, int, float] = entry.get()
+        self.tree_values[node_path] = str(value)
+        self._tree.set(iid, "value", str(value))
+
+        # Same string to number coercion as save_component_json
+        if node_path[-1] != "Version":
+            value = _coerce_value(value)
+
+        data_path = self.data["Components"]
+        for key in node_path[:-1]:
+            data_path = data_path[key]
+        data_path[node_path[-1]] = value
+        entry.place_forget()
+
+    def __add_widgets(self) -> None:
+        """
+        Builds the LabelFrame/Entry widgets for the whole component tree.
+
+        Walks the JSON tree iteratively with an explicit work deque instead of recursing,
+        and memoizes the gettext lookups since many keys repeat across components.
+        """
+        translations: dict[str, str] = {}
+
+        def translate(text: str) -> str:
+            return translations.setdefault(text, _(text))
+
+        components = self.data["Components"]
+        view_port = self.scroll_frame.view_port
+        # "add" items create the widgets for one node, "pack" items pack a LabelFrame
+        # after its whole subtree has been created (see populate_frames batching)
+        stack: deque[tuple] = deque(
+            ("add", view_port, key, value, (), components) for key, value in reversed(components.items())
+        )
+        while stack:
+            item = stack.pop()
+            if item[0] == "pack":
+                _tag, frame, pack_kwargs = item
+                frame.pack(**pack_kwargs)
+                continue
+            _tag, parent, key, value, path, parent_data = item
+            # JSON non-leaf elements, add LabelFrame widget
+            if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+                frame = ttk.LabelFrame(parent, text=translate(key))
+                is_toplevel = parent == view_port
+                if is_toplevel and key in components:
+                    self._add_template_controls(frame, key)
+                pady = 5 if is_toplevel else 3
+                stack.append(
+                    (
+                        "pack",
+                        frame,
+                        {
+                            "fill": tk.X,
+                            "side": tk.TOP if is_toplevel else tk.LEFT,
+                            "pady": pady,
+                            "padx": 5,
+                            "anchor": tk.NW if is_toplevel else tk.N,
+                        },
+                    )
+                )
+                stack.extend(
+                    ("add", frame, sub_key, sub_value, (*path, key), value) for sub_key, sub_value in reversed(value.items())
+                )
+            else:  # JSON leaf elements, add a placeholder upgraded to an Entry widget on demand
+                entry_frame = ttk.Frame(parent)
+                entry_frame.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
+
+                label = ttk.Label(entry_frame, text=translate(key))
+                label.pack(side=tk.LEFT)
+
+                # The real Entry/Combobox is only created once the leaf scrolls into view
+                # or is accessed programmatically, see _materialize_pending
+                placeholder = ttk.Label(entry_frame, text=str(value))
+                placeholder.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
+
+                self._pending_leaves[(*path, key)] = (entry_frame, placeholder, value)
+                self.entry_parents[(*path, key)] = (parent_data, key)
+
+        self._track_viewport_for_pending_leaves()
+
+    def _get_entry_widget(self, path: tuple) -> Union[None, ttk.Entry, ttk.Combobox]:
+        """Return the entry widget for path, materializing a pending leaf on demand."""
+        entry = self.entry_widgets.get(path)
+        if entry is None and path in self._pending_leaves:
+            entry = self._materialize_pending(path)
+        return entry
+
+    def _materialize_all_pending(self) -> None:
+        """Create the Entry widgets of all still-pending leaves, used before validation."""
+        for path in list(self._pending_leaves):
+            self._materialize_pending(path)
+
+    def _materialize_pending(self, path: tuple) -> Union[ttk.Entry, ttk.Combobox]:
+        """Replace the placeholder label of a pending leaf with its real Entry widget."""
+        entry_frame, placeholder, value = self._pending_leaves.pop(path)
+        placeholder.destroy()
+        entry = self.add_entry_or_combobox(value, entry_frame, path)
+        entry.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5))
+        self.entry_widgets[path] = entry
+        return entry
+
+    def _track_viewport_for_pending_leaves(self) -> None:
+        """Materialize pending leaves as they scroll into view."""
+        canvas = self.scroll_frame.canvas
+
+        # yscrollcommand fires on every scroll and resize, piggyback on it so no extra
+        # per-widget event bindings are needed
+        original_yscrollcommand = self.scroll_frame.vsb.set
+
+        def on_viewport_changed(first: str, last: str) -> None:
+            original_yscrollcommand(first, last)
+            self._materialize_visible_leaves()
+
+        canvas.configure(yscrollcommand=on_viewport_changed)
+        self.root.after_idle(self._materialize_visible_leaves)
+
+    def _materialize_visible_leaves(self) -> None:
+        """Create the Entry widgets of pending leaves within one screen of the viewport."""
+        if not self._pending_leaves:
+            return
+        canvas = self.scroll_frame.canvas
+        view_port = self.scroll_frame.view_port
+        if not canvas.winfo_ismapped():
+            return
+        view_top = canvas.canvasy(0)
+        view_height = canvas.winfo_height()
+        view_port_rooty = view_port.winfo_rooty()
+        for path, (entry_frame, _placeholder, _value) in list(self._pending_leaves.items()):
+            leaf_y = entry_frame.winfo_rooty() - view_port_rooty
+            if view_top - view_height <= leaf_y <= view_top + 2 * view_height:
+                self._materialize_pending(path)
+
+    def _add_template_controls(self, parent_frame: ttk.LabelFrame, component_name: str) -> None:
+        """Add template dropdown and save buttons for a component."""
+        label_frame = ttk.Frame(parent_frame)
+        label_frame.pack(side=tk.TOP, fill=tk.X)
+
+        label = ttk.Label(label_frame, text=_("Template:"))
+        label.pack(side=tk.LEFT, padx=(5, 5))
+
+        # Create and add the dropdown button
+        dropdown_button = ttk.Button(
+            label_frame, text="▼", width=2, command=lambda k=component_name: self.show_template_options(k)
+        )
+        self._register_tooltip(dropdown_button, _("Select a template for this component"))
+        dropdown_button.pack(side=tk.LEFT)
+
+        # Create and add the save template button
+        save_button = ttk.Button(
+            label_frame, text="+", width=2, command=lambda k=component_name: self.save_component_as_template(k)
+        )
+        self._register_tooltip(save_button, _("Save current configuration as template"))
+        save_button.pack(side=tk.LEFT, padx=(5, 0))
+
+        # Store the dropdown button reference
+        self.template_controls["buttons"][component_name] = dropdown_button
+
+    def save_component_as_template(self, component_name: str) -> None:
+        """Save the current component configuration as a template."""
+        component_data = self.data["Components"].get(component_name, {})
+        if not component_data:
+            messagebox.showerror(_("Error"), _("No data for component: ") + component_name)
+            return
+        template_name = simpledialog.askstring(_("Save Template"), _("Enter a name for this template:"), parent=self.root)
+        if not template_name:
+            return
+
+        templates = self.template_controls["cache"]
+        if component_name not in templates:
+            templates[component_name] = []
+
+        new_template = {"name": template_name, "data": component_data}
+
+        for i, template in enumerate(templates[component_name]):
+            if template.get("name") == template_name:
+                confirm = messagebox.askyesno(_("Template exists"), _("A template with this name already exists. Overwrite?"))
+                if confirm:
+                    templates[component_name][i] = new_template
+                    self.template_controls["manager"].save_component_templates(templates)
+                    self.template_controls["cache"] = templates
+                    messagebox.showinfo(_("Template Saved"), _("Template has been updated"))
+                return
+
+        templates[component_name].append(new_template)
+        self.template_controls["manager"].save_component_templates(templates)
+        self.template_controls["cache"] = templates
+        messagebox.showinfo(_("Template Saved"), _("Template has been saved"))
+
+    def create_template_dropdown_button(self, parent: ttk.Frame, component_name: str) -> ttk.Button:
+        """Creates a dropdown button for component templates."""
+        button = ttk.Button(parent, text="▼", width=2, command=lambda: self.show_template_options(component_name))
+        self._register_tooltip(button, _("Select a template for this component"))
+        return button
+
+    def show_template_options(self, component_name: str) -> None:
+        """Shows a dropdown menu with template options for the component."""
+        if self.template_controls["current_menu"] is not None:
+            self.template_controls["current_menu"].unpost()
+
+        button = self.template_controls["buttons"].get(component_name)
+        if not button:
+            return
+
+        templates = self.template_controls["cache"]
+        component_templates = templates.get(component_name, [])
+
+        menu = self._template_menu
+        menu.delete(0, "end")
+
+        if component_templates:
+            for template in component_templates:
+                template_name = template.get("name", "Template")
+                menu.add_command(
+                    label=template_name, command=lambda t=template, c=component_name: self.apply_component_template(c, t)
+                )
+        else:
+            menu.add_command(label=_("No templates available"), state="disabled")
+
+        x = button.winfo_rootx()
+        y = button.winfo_rooty() + button.winfo_height()
+        # tk_popup grabs the pointer so a click anywhere else dismisses the menu on all
+        # platforms (plain post() does not set a grab on X11), firing the <Unmap> handler
+        menu.tk_popup(x, y)
+
+        self.template_controls["current_menu"] = menu
+
+    def apply_component_template(self, component_name: str, template: dict) -> None:
+        """Apply a template to a component."""
+        if "data" not in template:
+            return
+
+        template_data = template["data"]
+        self.data["Components"][component_name] = template_data
+
+        # The cached (parent dict, key) links of this component point into the replaced
+        # subtree; drop them so later edits resolve against the template data just installed
+        for path in list(self.entry_parents):
+            if path[0] == component_name:
+                del self.entry_parents[path]
+
+        # Flatten the template once instead of re-navigating it from the root for every entry
+        flat: dict[tuple, Any] = {}
+        stack: list[tuple[tuple, dict]] = [((), template_data)]
+        while stack:
+            prefix, subtree = stack.pop()
+            for key, value in subtree.items():
+                if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+                    stack.append(((*prefix, key), value))
+                else:
+                    flat[(*prefix, key)] = value
+
+        for path, entry in self.entry_widgets.items():
+            if len(path) >= 1 and path[0] == component_name and path[1:] in flat:
+                entry.delete(0, tk.END)
+                entry.insert(0, str(flat[path[1:]]))
+
+        # Leaves still showing their placeholder get the new value there and keep it
+        # for the eventual materialization
+        for path, (entry_frame, placeholder, _old_value) in list(self._pending_leaves.items()):
+            if len(path) >= 1 and path[0] == component_name and path[1:] in flat:
+                value = flat[path[1:]]
+                placeholder.config(text=str(value))
+                self._pending_leaves[path] = (entry_frame, placeholder, value)
+
+        template_name = template.get("name", "Template")
+        messagebox.showinfo(_("Template Applied"), _("{} has been applied to {}").format(template_name, component_name))
+
+    def validate_and_save_component_json(self) -> None:
+        """Saves the edited JSON data back to the file."""
+        confirm_message = _(
+            "ArduPilot Methodic Configurator only operates correctly if all component properties are correct."
+            " ArduPilot parameter values depend on the components used and their connections.\n\n"
+            " Have you used the scrollbar on the right side of the window and "
+            "entered the correct values for all components?"
+        )
+        user_confirmation = messagebox.askyesno(_("Confirm that all component properties are correct"), confirm_message)
+
+        if not user_confirmation:
+            # User chose 'No', so return and do not save data
+            return
+
+        self.save_component_json()
+
+    def save_component_json(self) -> None:
+        # User confirmed, proceed with saving the data
+        for path, entry in self.entry_widgets.items():
+            value: Union[str, int, float] = entry.get()
+
+            if path[-1] != "Version":
+                value = _coerce_value(value)
+
+            # Update the value in the data dictionary
+            parent_data, leaf_key = self._get_parent_and_leaf(path)
+            parent_data[leaf_key] = value
+
+        # Save the updated data back to the JSON file
+        failed, msg = self.local_filesystem.save_vehicle_components_json_data(self.data, self.local_filesystem.vehicle_dir)
+        if failed:
+            show_error_message(_("Error"), _("Failed to save data to file.") + "\n" + msg)
+        else:
+            logging_info(_("Vehicle component data saved successfully."))
+        self.root.destroy()
+
+    def on_closing(self) -> None:
+        """Handle window closing event."""
+        answer = messagebox.askyesnocancel(_("Save Changes?"), _("Do you want to save the changes before closing?"))
+
+        if answer is None:  # Cancel was clicked
+            return
+
+        if answer:
+            self.save_component_json()
+        else:
+            self.root.destroy()
+        sys_exit(0)
+
+    # This function will be overwritten in child classes
+    def add_entry_or_combobox(
+        self, value: float, entry_frame: ttk.Frame, _path: tuple[str, str, str]
+    ) -> Union[ttk.Entry, ttk.Combobox]:
+        entry = ttk.Entry(entry_frame)
+        entry.insert(0, str(value))
+        return entry
+
+    @staticmethod
+    def add_argparse_arguments(parser: "ArgumentParser") -> "ArgumentParser":
+        # the registration body lives in common_arguments, so the main entry point can
+        # build its parser without importing the Tk stack through this module
+        return add_component_editor_arguments(parser)
+
+
+if __name__ == "__main__":
+    from logging import basicConfig as logging_basicConfig
+    from logging import getLevelName as logging_getLevelName
+
+    args = argument_parser()
+
+    logging_basicConfig(level=logging_getLevelName(args.loglevel), format="%(asctime)s - %(levelname)s - %(message)s")
+
+    filesystem = LocalFilesystem(args.vehicle_dir, args.vehicle_type, "", args.allow_editing_template_files)
+    app = ComponentEditorWindowBase(__version__, filesystem)
+    app.root.mainloop()
@@ -31,7 +31,7 @@ from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem,
 from ardupilot_methodic_configurator.backend_filesystem_program_settings import ProgramSettings
 from ardupilot_methodic_configurator.backend_flightcontroller import FlightController
 from ardupilot_methodic_configurator.backend_internet import download_file_from_url
-from ardupilot_methodic_configurator.common_arguments import add_common_arguments
+from ardupilot_methodic_configurator.common_arguments import add_common_arguments, add_parameter_editor_arguments
 from ardupilot_methodic_configurator.frontend_tkinter_base import (
     AutoResizeCombobox,
     BaseWindow,
@@ -843,7 +843,7 @@ class ParameterEditorWindow(BaseWindow):  # pylint: disable=too-many-instance-at
 
     @staticmethod
     def add_argparse_arguments(parser: ArgumentParser) -> ArgumentParser:
-        return parser
+        return add_parameter_editor_arguments(parser)
 
 
 def argument_parser() -> Namespace:
@@ -32,6 +32,7 @@ from ardupilot_methodic_configurator.backend_internet import (
     download_and_install_pip_release,
     get_release_info,
 )
+from ardupilot_methodic_configurator.common_arguments import add_update_manager_arguments
 from ardupilot_methodic_configurator.frontend_tkinter_software_update import UpdateDialog
 
 
@@ -106,12 +107,7 @@ class UpdateManager:
 
     @staticmethod
     def add_argparse_arguments(parser: ArgumentParser) -> ArgumentParser:
-        parser.add_argument(
-            "--skip-check-for-updates",
-            action="store_true",
-            help=_("Skip check for software updates before staring the software. Default is %(default)s."),
-        )
-        return parser
+        return add_update_manager_arguments(parser)
 
 
 def check_for_software_updates() -> bool:
@@ -43,7 +43,7 @@ class TestArgumentParser(unittest.TestCase):
 class TestMainFunctions(unittest.TestCase):
     """Test the main functions of the __main__.py file."""
 
-    @patch("ardupilot_methodic_configurator.__main__.FlightController")
+    @patch("ardupilot_methodic_configurator.backend_flightcontroller.FlightController")
     def test_connect_to_fc_and_read_parameters(self, mock_flight_controller) -> None:
         mock_fc = mock_flight_controller.return_value
         mock_fc.connect.return_value = ""
@@ -57,9 +57,10 @@ class TestMainFunctions(unittest.TestCase):
         assert flight_controller == mock_fc
         assert vehicle_type == "quad"
 
-    @patch("ardupilot_methodic_configurator.__main__.ComponentEditorWindow")
-    @patch("ardupilot_methodic_configurator.__main__.LocalFilesystem")
-    @patch("ardupilot_methodic_configurator.__main__.ProgramSettings")
+    # component_editor() imports its dependencies lazily, patch them in their home modules
+    @patch("ardupilot_methodic_configurator.frontend_tkinter_component_editor.ComponentEditorWindow")
+    @patch("ardupilot_methodic_configurator.backend_filesystem.LocalFilesystem")
+    @patch("ardupilot_methodic_configurator.backend_filesystem_program_settings.ProgramSettings")
     def test_component_editor(self, mock_program_settings, mock_local_filesystem, mock_component_editor_window) -> None:
         mock_program_settings = mock_program_settings.return_value
         mock_program_settings.get_setting.return_value = True
@@ -13,7 +13,7 @@ SPDX-License-Identifier: GPL-3.0-or-later
 import unittest
 from unittest.mock import mock_open, patch
 
-from ardupilot_methodic_configurator.backend_filesystem_configuration_steps import ConfigurationSteps
+from ardupilot_methodic_configurator.backend_filesystem_configuration_steps import ConfigurationSteps, orjson_loads
 
 
 class TestConfigurationSteps(unittest.TestCase):
@@ -38,10 +38,14 @@ class TestConfigurationSteps(unittest.TestCase):
         mock_join.side_effect = lambda *args: "/".join(args)
         self.config_steps.re_init("vehicle_dir", "vehicle_type")
         assert self.config_steps.configuration_steps
+        # _load_json_file opens the files in binary mode when orjson is available,
+        # in text mode with an explicit encoding otherwise
+        open_args = ("rb",) if orjson_loads is not None else ()
+        open_kwargs = {} if orjson_loads is not None else {"encoding": "utf-8"}
         mock_open2.assert_has_calls(
             [
-                unittest.mock.call("vehicle_dir/configuration_steps_vehicle_type.json", encoding="utf-8"),
-                unittest.mock.call("dir_name/configuration_steps_schema.json", encoding="utf-8"),
+                unittest.mock.call("vehicle_dir/configuration_steps_vehicle_type.json", *open_args, **open_kwargs),
+                unittest.mock.call("dir_name/configuration_steps_schema.json", *open_args, **open_kwargs),
             ],
             any_order=True,
         )
@@ -10,18 +10,44 @@ SPDX-FileCopyrightText: 2024-2025 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
 SPDX-License-Identifier: GPL-3.0-or-later
 """
 
+import json
+import os
 import os.path
+import tempfile
 import unittest
 from unittest.mock import mock_open, patch
 
-from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import VehicleComponents
+import ardupilot_methodic_configurator
+from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import (
+    IjsonJSONError,
+    VehicleComponents,
+    _load_component_templates_cached,
+    _load_schema_cached,
+    fastjsonschema_compile,
+)
 from ardupilot_methodic_configurator.middleware_template_overview import TemplateOverview
 
 
+def _shipped_template_data() -> dict:
+    """Load a vehicle_components.json shipped with the package, valid against the real schema."""
+    package_dir = os.path.dirname(ardupilot_methodic_configurator.__file__)
+    templates_dir = os.path.join(package_dir, "vehicle_templates")
+    for root, _dirs, files in sorted(os.walk(templates_dir)):
+        if VehicleComponents.vehicle_components_json_filename in files:
+            with open(os.path.join(root, VehicleComponents.vehicle_components_json_filename), encoding="utf-8") as file:
+                return json.load(file)
+    msg = f"no vehicle_components.json found under {templates_dir}"
+    raise FileNotFoundError(msg)
+
+
 class TestVehicleComponents(unittest.TestCase):
     """VehicleComponents test class."""
 
     def setUp(self) -> None:
+        # The module-level loaders cache across instances, start each test with a cold cache
+        _load_schema_cached.cache_clear()
+        _load_component_templates_cached.cache_clear()
+        VehicleComponents._validation_cache.clear()
         self.vehicle_components = VehicleComponents()
         # Sample valid schema
         self.valid_schema = {
@@ -60,34 +86,145 @@ class TestVehicleComponents(unittest.TestCase):
         assert not is_valid
         assert "Validation error" in error_message
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.json_load")
+    def test_validate_vehicle_components_real_schema(self) -> None:
+        # No mocking: exercise the genuine load_schema -> validator path with the schema
+        # shipped in the package. With fastjsonschema installed the valid document takes
+        # the fast path and the invalid one falls back to jsonschema for its error message
+        template_data = _shipped_template_data()
+        is_valid, error_message = self.vehicle_components.validate_vehicle_components(template_data)
+        assert is_valid
+        assert error_message == ""
+        assert (self.vehicle_components._fast_validate is not None) == (fastjsonschema_compile is not None)
+
+        is_valid, error_message = self.vehicle_components.validate_vehicle_components(self.invalid_component_data)
+        assert not is_valid
+        assert "Validation error" in error_message
+
+    def test_load_schema_compiles_validator_once(self) -> None:
+        # The compiled validators are cached per schema path and shared by all instances
+        VehicleComponents._validator_cache.clear()
+        VehicleComponents._fast_validator_cache.clear()
+        assert self.vehicle_components.load_schema()
+        assert len(VehicleComponents._validator_cache) == 1
+
+        other = VehicleComponents()
+        assert other.load_schema()
+        assert other._validator is self.vehicle_components._validator
+        if fastjsonschema_compile is not None:
+            assert len(VehicleComponents._fast_validator_cache) == 1
+            assert other._fast_validate is self.vehicle_components._fast_validate
+
+    def test_validate_vehicle_components_fast_path_fallback(self) -> None:
+        # A fast-path rejection must fall through to jsonschema so the user still gets
+        # its richer error message, simulated here so the test does not depend on
+        # fastjsonschema being installed
+        class FakeFastError(Exception):
+            pass
+
+        def fake_fast_validate(_data: dict) -> None:
+            raise FakeFastError
+
+        patch_target = "ardupilot_methodic_configurator.backend_filesystem_vehicle_components.FastJsonSchemaException"
+        with patch(patch_target, FakeFastError, create=True):
+            assert self.vehicle_components.load_schema()
+            self.vehicle_components._fast_validate = fake_fast_validate
+            is_valid, error_message = self.vehicle_components.validate_vehicle_components(self.invalid_component_data)
+        assert not is_valid
+        assert "Validation error" in error_message
+
+    def _write_vehicle_components_json(self, vehicle_dir: str, data: dict) -> None:
+        with open(os.path.join(vehicle_dir, "vehicle_components.json"), "w", encoding="utf-8") as file:
+            json.dump(data, file)
+
     @patch.object(VehicleComponents, "validate_vehicle_components")
-    def test_load_vehicle_components_json_data(self, mock_validate, mock_json_load, mock_file) -> None:
-        mock_json_load.return_value = self.valid_component_data
+    def test_load_vehicle_components_json_data(self, mock_validate) -> None:
         mock_validate.return_value = (True, "")
 
-        result = self.vehicle_components.load_vehicle_components_json_data("/test/dir")
+        with tempfile.TemporaryDirectory() as vehicle_dir:
+            self._write_vehicle_components_json(vehicle_dir, self.valid_component_data)
+            result = self.vehicle_components.load_vehicle_components_json_data(vehicle_dir)
 
         assert result == self.valid_component_data
         assert self.vehicle_components.vehicle_components == self.valid_component_data
+        mock_validate.assert_called_once()
 
-        expected_path = os.path.join("/test/dir", "vehicle_components.json")
-        mock_file.assert_called_once_with(expected_path, encoding="utf-8")
-        mock_json_load.assert_called_once()
+    @patch.object(VehicleComponents, "validate_vehicle_components")
+    def test_load_vehicle_components_json_data_without_validation(self, mock_validate) -> None:
+        with tempfile.TemporaryDirectory() as vehicle_dir:
+            self._write_vehicle_components_json(vehicle_dir, self.valid_component_data)
+            result = self.vehicle_components.load_vehicle_components_json_data(vehicle_dir, validate=False)
+
+        assert result == self.valid_component_data
+        mock_validate.assert_not_called()
+
+    _IJSON_KVITEMS = "ardupilot_methodic_configurator.backend_filesystem_vehicle_components.ijson_kvitems"
+
+    def _write_padded_vehicle_components_json(self, vehicle_dir: str) -> None:
+        # pad the file above _PARTIAL_LOAD_THRESHOLD so the streaming branch is eligible
+        padded = dict(self.valid_component_data)
+        padded["Padding"] = "x" * (VehicleComponents._PARTIAL_LOAD_THRESHOLD + 1)
+        self._write_vehicle_components_json(vehicle_dir, padded)
+
+    def test_load_components_partial_small_file_uses_full_loader(self) -> None:
+        with patch(self._IJSON_KVITEMS) as mock_kvitems, tempfile.TemporaryDirectory() as vehicle_dir:
+            self._write_vehicle_components_json(vehicle_dir, self.valid_component_data)
+            result = self.vehicle_components.load_components_partial(vehicle_dir)
+            # a missing file yields an empty dict, same as the full loader
+            assert self.vehicle_components.load_components_partial(os.path.join(vehicle_dir, "nonexistent")) == {}
+
+        assert result == self.valid_component_data["Components"]
+        # below the size threshold a full parse is cheaper, the streaming parser must not run
+        mock_kvitems.assert_not_called()
+
+    def test_load_components_partial_streams_large_file(self) -> None:
+        def fake_kvitems(file, prefix: str) -> list:
+            assert prefix == "Components"
+            return list(json.load(file)["Components"].items())
+
+        with (
+            patch(self._IJSON_KVITEMS, side_effect=fake_kvitems) as mock_kvitems,
+            tempfile.TemporaryDirectory() as vehicle_dir,
+        ):
+            self._write_padded_vehicle_components_json(vehicle_dir)
+            result = self.vehicle_components.load_components_partial(vehicle_dir)
+
+        assert result == self.valid_component_data["Components"]
+        mock_kvitems.assert_called_once()
+
+    def test_load_components_partial_malformed_file_falls_back(self) -> None:
+        # a streaming-parser error must not propagate out of an overview scan,
+        # the regular full loader gets a second try at the file
+        with (
+            patch(self._IJSON_KVITEMS, side_effect=IjsonJSONError("malformed")) as mock_kvitems,
+            tempfile.TemporaryDirectory() as vehicle_dir,
+        ):
+            self._write_padded_vehicle_components_json(vehicle_dir)
+            result = self.vehicle_components.load_components_partial(vehicle_dir)
+
+        assert result == self.valid_component_data["Components"]
+        mock_kvitems.assert_called_once()
+
+    @patch(_IJSON_KVITEMS, None)
+    def test_load_components_partial_without_ijson(self) -> None:
+        with tempfile.TemporaryDirectory() as vehicle_dir:
+            self._write_padded_vehicle_components_json(vehicle_dir)
+            result = self.vehicle_components.load_components_partial(vehicle_dir)
+
+        assert result == self.valid_component_data["Components"]
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.json_dump")
     @patch.object(VehicleComponents, "validate_vehicle_components")
-    def test_save_vehicle_components_json_data_valid(self, mock_validate, mock_json_dump, mock_file) -> None:
+    def test_save_vehicle_components_json_data_valid(self, mock_validate) -> None:
         mock_validate.return_value = (True, "")
 
-        result, _msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/test/dir")
+        with tempfile.TemporaryDirectory() as vehicle_dir:
+            result, _msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, vehicle_dir)
 
-        assert not result  # False means success
-        expected_path = os.path.join("/test/dir", "vehicle_components.json")
-        mock_file.assert_called_once_with(expected_path, "w", encoding="utf-8", newline="\n")
-        mock_json_dump.assert_called_once()
+            assert not result  # False means success
+            expected_path = os.path.join(vehicle_dir, "vehicle_components.json")
+            with open(expected_path, encoding="utf-8") as file:
+                assert json.load(file) == self.valid_component_data
+            # the write is atomic, no temporary file may be left behind
+            assert os.listdir(vehicle_dir) == ["vehicle_components.json"]
 
     @patch.object(VehicleComponents, "validate_vehicle_components")
     def test_save_vehicle_components_json_data_invalid(self, mock_validate) -> None:
@@ -128,23 +265,24 @@ class TestVehicleComponents(unittest.TestCase):
         assert "ArduPlane" in supported
         assert len(supported) >= 9  # Ensure all expected vehicles are present
 
-    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.os_walk")
-    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.os_path.relpath")
     @patch.object(VehicleComponents, "load_vehicle_components_json_data")
     @patch("ardupilot_methodic_configurator.backend_filesystem_program_settings.ProgramSettings.get_templates_base_dir")
-    def test_get_vehicle_components_overviews(self, mock_get_base_dir, mock_load_data, mock_relpath, mock_walk) -> None:
-        mock_get_base_dir.return_value = "/templates"
-        mock_walk.return_value = [
-            ("/templates/copter", [], ["vehicle_components.json"]),
-            ("/templates/plane", [], ["vehicle_components.json"]),
-        ]
-        mock_relpath.side_effect = ["copter", "plane"]
-        mock_load_data.side_effect = [
-            {"Components": {"Flight Controller": {"Firmware": {"Type": "ArduCopter"}}}},
-            {"Components": {"Flight Controller": {"Firmware": {"Type": "ArduPlane"}}}},
-        ]
-
-        result = VehicleComponents.get_vehicle_components_overviews()
+    def test_get_vehicle_components_overviews(self, mock_get_base_dir, mock_load_data) -> None:
+        component_data = {
+            "copter": {"Components": {"Flight Controller": {"Firmware": {"Type": "ArduCopter"}}}},
+            "plane": {"Components": {"Flight Controller": {"Firmware": {"Type": "ArduPlane"}}}},
+        }
+        with tempfile.TemporaryDirectory() as templates_dir:
+            mock_get_base_dir.return_value = templates_dir
+            for subdir in component_data:
+                os.makedirs(os.path.join(templates_dir, subdir))
+                with open(os.path.join(templates_dir, subdir, "vehicle_components.json"), "w", encoding="utf-8") as file:
+                    file.write("{}")
+            # A directory without a vehicle_components.json file must not show up in the result
+            os.makedirs(os.path.join(templates_dir, "empty"))
+            mock_load_data.side_effect = lambda root, **_kwargs: component_data[os.path.basename(root)]
+
+            result = VehicleComponents.get_vehicle_components_overviews()
 
         assert len(result) == 2
         assert "copter" in result
@@ -192,36 +330,33 @@ class TestVehicleComponents(unittest.TestCase):
         assert result["Components"]["Flight Controller"]["Options"]["Enabled"] == 0
         assert result["Components"]["Flight Controller"]["Options"]["Value"] == 0.0
 
-    @patch("builtins.open")
-    def test_save_vehicle_components_json_data_file_not_found(self, mock_open) -> None:  # pylint: disable=redefined-outer-name
-        mock_open.side_effect = FileNotFoundError()
-
+    def test_save_vehicle_components_json_data_file_not_found(self) -> None:
         result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/nonexistent/dir")
 
         assert result  # True means error
         assert "not found" in msg
 
-    @patch("builtins.open")
-    def test_save_vehicle_components_json_data_permission_error(self, mock_open) -> None:  # pylint: disable=redefined-outer-name
-        mock_open.side_effect = PermissionError()
+    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.NamedTemporaryFile")
+    def test_save_vehicle_components_json_data_permission_error(self, mock_tmp_file) -> None:
+        mock_tmp_file.side_effect = PermissionError()
 
         result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/test/dir")
 
         assert result  # True means error
         assert "Permission denied" in msg
 
-    @patch("builtins.open")
-    def test_save_vehicle_components_json_data_is_a_directory_error(self, mock_open) -> None:  # pylint: disable=redefined-outer-name
-        mock_open.side_effect = IsADirectoryError()
+    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.NamedTemporaryFile")
+    def test_save_vehicle_components_json_data_is_a_directory_error(self, mock_tmp_file) -> None:
+        mock_tmp_file.side_effect = IsADirectoryError()
 
         result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/test/dir")
 
         assert result  # True means error
         assert "is a directory" in msg.lower()
 
-    @patch("builtins.open")
-    def test_save_vehicle_components_json_data_os_error(self, mock_open) -> None:  # pylint: disable=redefined-outer-name
-        mock_open.side_effect = OSError("Disk full")
+    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.NamedTemporaryFile")
+    def test_save_vehicle_components_json_data_os_error(self, mock_tmp_file) -> None:
+        mock_tmp_file.side_effect = OSError("Disk full")
 
         result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/test/dir")
 
@@ -229,27 +364,30 @@ class TestVehicleComponents(unittest.TestCase):
         assert "OS error" in msg
         assert "Disk full" in msg
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.json_dump")
-    def test_save_vehicle_components_json_data_type_error(self, mock_json_dump, mock_file) -> None:  # pylint: disable=unused-argument
-        mock_json_dump.side_effect = TypeError("Invalid type")
+    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components._json_dump_pretty")
+    def test_save_vehicle_components_json_data_type_error(self, mock_json_dump_pretty) -> None:
+        mock_json_dump_pretty.side_effect = TypeError("Invalid type")
 
-        result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/test/dir")
+        with tempfile.TemporaryDirectory() as vehicle_dir:
+            result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, vehicle_dir)
 
-        assert result  # True means error
-        assert "Type error" in msg
-        assert "Invalid type" in msg
+            assert result  # True means error
+            assert "Type error" in msg
+            assert "Invalid type" in msg
+            # the failed write may not leave a temporary file behind
+            assert os.listdir(vehicle_dir) == []
 
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components.json_dump")
-    def test_save_vehicle_components_json_data_value_error(self, mock_json_dump, mock_file) -> None:  # pylint: disable=unused-argument
-        mock_json_dump.side_effect = ValueError("Circular reference")
+    @patch("ardupilot_methodic_configurator.backend_filesystem_vehicle_components._json_dump_pretty")
+    def test_save_vehicle_components_json_data_value_error(self, mock_json_dump_pretty) -> None:
+        mock_json_dump_pretty.side_effect = ValueError("Circular reference")
 
-        result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, "/test/dir")
+        with tempfile.TemporaryDirectory() as vehicle_dir:
+            result, msg = self.vehicle_components.save_vehicle_components_json_data(self.valid_component_data, vehicle_dir)
 
-        assert result  # True means error
-        assert "Value error" in msg
-        assert "Circular reference" in msg
+            assert result  # True means error
+            assert "Value error" in msg
+            assert "Circular reference" in msg
+            assert os.listdir(vehicle_dir) == []
 
 
 if __name__ == "__main__":
@@ -17,7 +17,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ardupilot_methodic_configurator.backend_filesystem import LocalFilesystem
-from ardupilot_methodic_configurator.frontend_tkinter_component_editor_base import ComponentEditorWindowBase
+from ardupilot_methodic_configurator.frontend_tkinter_component_editor_base import ComponentEditorWindowBase, _coerce_value
 
 
 @pytest.fixture
@@ -39,6 +39,7 @@ def editor_with_mocked_root() -> ComponentEditorWindowBase:
 
         # Setup test data
         editor.entry_widgets = {}
+        editor.entry_parents = {}
         editor.data = {"Components": {"Motor": {"Type": "brushless", "KV": 1000}}}
 
         yield editor
@@ -216,6 +217,32 @@ def test_save_component_json_failure(mock_error_message, editor_with_mocked_root
     editor_with_mocked_root.root.destroy.assert_called_once()
 
 
+def test_coerce_value() -> None:
+    """Test the _coerce_value string-to-number conversion."""
+    # everything int() accepts must become an int
+    assert _coerce_value("42") == 42
+    assert _coerce_value("+5") == 5
+    assert _coerce_value("-7") == -7
+    assert _coerce_value("1_000") == 1000
+    assert isinstance(_coerce_value("42"), int)
+
+    # everything float() accepts (except inf/nan) must become a float
+    assert _coerce_value(" 3.14 ") == 3.14
+    assert _coerce_value(".5") == 0.5
+    assert _coerce_value("+.5") == 0.5
+    assert _coerce_value("5.") == 5.0
+    assert _coerce_value("1.5e-3") == 0.0015
+    assert _coerce_value("1e20") == 1e20
+    assert isinstance(_coerce_value(".5"), float)
+
+    # non-numeric entries stay strings, stripped of surrounding whitespace
+    assert _coerce_value("brushless") == "brushless"
+    assert _coerce_value(" 5S ") == "5S"
+    assert _coerce_value("2x4") == "2x4"
+    assert _coerce_value("1__0") == "1__0"
+    assert _coerce_value("") == ""
+
+
 def test_add_argparse_arguments() -> None:
     """Test adding command line arguments."""
     parser = MagicMock()
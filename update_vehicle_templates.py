@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+
+"""
+Re-write all vehicle template vehicle_components.json files. For dev only.
+
+Loads every vehicle_components.json file in the vehicle template directories and saves it
+back, so that schema migrations and formatting changes get applied to all templates at once.
+
+This file is part of Ardupilot methodic configurator. https://github.com/ArduPilot/MethodicConfigurator
+
+SPDX-FileCopyrightText: 2024-2025 Amilcar do Carmo Lucas <amilcar.lucas@iav.de>
+
+SPDX-License-Identifier: GPL-3.0-or-later
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from importlib.resources import files as importlib_files
+
+from ardupilot_methodic_configurator import __version__
+from ardupilot_methodic_configurator.backend_filesystem_vehicle_components import VehicleComponents, _json_dump_pretty
+
+# Per-directory cache file recording the components file state of the last run
+CACHE_FILENAME = ".mc_cache"
+
+
+def template_base_directory() -> str:
+    """Return the vehicle_templates directory of the installed package, wherever that is."""
+    return str(importlib_files("ardupilot_methodic_configurator") / "vehicle_templates")
+
+
+def components_file_fingerprint(filepath: str) -> dict:
+    """Return the mtime, content hash and program version fingerprint of a components file."""
+    with open(filepath, "rb") as file:
+        file_bytes = file.read()
+    return {
+        "mtime_ns": os.stat(filepath).st_mtime_ns,
+        "blake2b": hashlib.blake2b(file_bytes, digest_size=16).hexdigest(),
+        "version": __version__,
+    }
+
+
+def find_template_directories(base_dir: str) -> list[str]:
+    """Return all directories below base_dir that contain a vehicle components file."""
+    file_to_find = VehicleComponents.vehicle_components_json_filename
+    template_dirs = []
+    # os.scandir reuses the directory entry type information, unlike os.walk which
+    # stats every entry twice; that halves the syscalls per directory entry
+    stack = [base_dir]
+    while stack:
+        current_dir = stack.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == file_to_find:
+                        template_dirs.append(current_dir)
+        except OSError as e:
+            logging.error("Error scanning directory %s: %s", current_dir, e)
+    return sorted(template_dirs)
+
+
+def _components_file_would_change(filepath: str, data: dict) -> bool:
+    """Return whether saving data would produce different file contents than are on disk."""
+    try:
+        buffer = io.StringIO()
+        _json_dump_pretty(data, buffer)
+        with open(filepath, encoding="utf-8", newline="\n") as file:
+            return file.read() != buffer.getvalue()
+    except (OSError, TypeError, ValueError):
+        return True  # let the real save and its error handling decide
+
+
+def write_cache(cache_filepath: str, filepath: str) -> None:
+    """Remember the current components file state, so the next run can skip this directory."""
+    try:
+        with open(cache_filepath, "w", encoding="utf-8") as file:
+            json.dump(components_file_fingerprint(filepath), file)
+    except OSError as e:
+        logging.warning("Could not write %s: %s", cache_filepath, e)
+
+
+def process_template_directory(template_dir: str) -> bool:
+    """Load and re-save the vehicle components file of one template directory."""
+    filepath = os.path.join(template_dir, VehicleComponents.vehicle_components_json_filename)
+    cache_filepath = os.path.join(template_dir, CACHE_FILENAME)
+
+    # Skip directories whose components file is unchanged since the last run of this version
+    try:
+        fingerprint = components_file_fingerprint(filepath)
+        with open(cache_filepath, encoding="utf-8") as file:
+            if json.load(file) == fingerprint:
+                logging.info("Skipping %s, unchanged since the last run", template_dir)
+                return True
+    except (OSError, ValueError):
+        pass  # no usable cache, process the directory
+
+    vehicle_components = VehicleComponents()
+    data = vehicle_components.load_vehicle_components_json_data(template_dir)
+    if not data:
+        logging.error("Failed to load %s from %s", VehicleComponents.vehicle_components_json_filename, template_dir)
+        return False
+
+    # Skip the disk write, the most expensive step per template, when re-serializing
+    # would reproduce the file byte for byte
+    if not _components_file_would_change(filepath, data):
+        logging.info("Skipping write for %s, contents are unchanged", template_dir)
+        write_cache(cache_filepath, filepath)
+        return True
+
+    error_occurred, error_message = vehicle_components.save_vehicle_components_json_data(data, template_dir)
+    if error_occurred:
+        logging.error("Failed to update %s: %s", template_dir, error_message)
+        return False
+
+    write_cache(cache_filepath, filepath)
+    logging.info("Updated %s", template_dir)
+    return True
+
+
+def init_worker_logging() -> None:
+    """Configure logging in each worker process, so their messages match the main process."""
+    logging.basicConfig(level="INFO", format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def argument_parser() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="use a thread pool instead of a process pool; starts faster and overlaps disk latency,"
+        " while the default process pool wins when the JSON encoding dominates",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    init_worker_logging()
+    args = argument_parser()
+
+    base_dir = template_base_directory()
+    template_dirs = find_template_directories(base_dir)
+    logging.info("Found %d vehicle template directories in %s", len(template_dirs), base_dir)
+
+    # Each directory is processed independently, so spread them over all cores.
+    # Threads avoid the process spawn cost (noticeable on Windows) and the work is
+    # mostly file I/O, so they are a good fit when --threads is given.
+    if args.threads:
+        executor = ThreadPoolExecutor(max_workers=8)
+    else:
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker_logging)
+    with executor:
+        results = list(executor.map(process_template_directory, template_dirs, chunksize=4))
+    failed = sum(not result for result in results)
+    if failed:
+        logging.error("%d of %d vehicle template directories failed to update", failed, len(template_dirs))
+
+
+if __name__ == "__main__":
+    main()